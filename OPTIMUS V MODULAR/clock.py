@@ -0,0 +1,25 @@
+# clock.py
+import asyncio
+
+class SimulationClock:
+    """Source of simulated time; `sleep` advances `now` by the given number of seconds."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    async def sleep(self, seconds):
+        raise NotImplementedError("Must be implemented by subclasses")
+
+class RealTimeClock(SimulationClock):
+    """Paces the simulation in wall-clock time, e.g. for a live dashboard."""
+
+    async def sleep(self, seconds):
+        self.now += seconds
+        await asyncio.sleep(seconds)
+
+class VirtualClock(SimulationClock):
+    """Fast-forward mode: time advances instantly so batch runs go at CPU speed."""
+
+    async def sleep(self, seconds):
+        self.now += seconds
+        await asyncio.sleep(0)  # Still yield so interleaved simulations make progress
@@ -1,10 +1,10 @@
 # society.py
 import logging
 import random
-import asyncio
 import numpy as np
 from political_system import Parliament, Government, President, PrimeMinister
 from judicial_system import JudicialSystem
+from clock import RealTimeClock
 from logging_config import configure_logger
 from analysis import calculate_correlations, plot_results, perform_granger_test
 from visualizations import initialize_graph, update_node_sizes, update_edges, visualize_graph  # Import visualization functions
@@ -18,9 +18,10 @@ class Society:
     norms = {}
     regulations = {}
 
-    def __init__(self, use_fixed_seed=True):
+    def __init__(self, use_fixed_seed=True, clock=None):
         if use_fixed_seed:
             random.seed(1)
+        self.clock = clock if clock is not None else RealTimeClock()
 
         self.president = President("Jean Dupont")
         self.prime_minister = PrimeMinister("Alice Martin")
@@ -73,7 +74,7 @@ class Society:
 
             # Track historical data
             self.track_histories()
-            await asyncio.sleep(0.1)
+            await self.clock.sleep(0.1)
         await self.finalize_simulation()
 
     def adjust_citizen_pressure(self, event, citizen_pressure):
@@ -97,7 +98,7 @@ class Society:
         })
 
     async def finalize_simulation(self):
-        await asyncio.sleep(0.1)
+        await self.clock.sleep(0.1)
         calculate_correlations(self.caseload_history, self.normative_inflation_history, self.temporal_gap_history)
         plot_results(self.caseload_history, self.normative_inflation_history, self.temporal_gap_history)
         perform_granger_test(self.normative_inflation_history, self.caseload_history)
\ No newline at end of file
@@ -4,26 +4,27 @@ import logging
 import time
 
 # Configuration du logging pour le fichier et le terminal
-logger = logging.getLogger()
-logger.setLevel(logging.DEBUG)
-
-# Supprimer tous les handlers existants pour éviter la duplication
-if logger.hasHandlers():
-    logger.handlers.clear()
-
-# Handler pour le fichier
-file_handler = logging.FileHandler('journalofficiel2.log', 'a')
-file_handler.setLevel(logging.DEBUG)
-file_formatter = logging.Formatter('%(message)s')
-file_handler.setFormatter(file_formatter)
-logger.addHandler(file_handler)
-
-# Handler pour le terminal
-console_handler = logging.StreamHandler()
-console_handler.setLevel(logging.DEBUG)
-console_formatter = logging.Formatter('%(message)s')
-console_handler.setFormatter(console_formatter)
-logger.addHandler(console_handler)
+def configure_logging():
+    logger = logging.getLogger()
+    logger.setLevel(logging.DEBUG)
+
+    # Supprimer tous les handlers existants pour éviter la duplication
+    if logger.hasHandlers():
+        logger.handlers.clear()
+
+    # Handler pour le fichier
+    file_handler = logging.FileHandler('journalofficiel2.log', 'a')
+    file_handler.setLevel(logging.DEBUG)
+    file_formatter = logging.Formatter('%(message)s')
+    file_handler.setFormatter(file_formatter)
+    logger.addHandler(file_handler)
+
+    # Handler pour le terminal
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(logging.DEBUG)
+    console_formatter = logging.Formatter('%(message)s')
+    console_handler.setFormatter(console_formatter)
+    logger.addHandler(console_handler)
 
 # Constantes
 COMPLEXITÉ_MIN = 1
@@ -526,7 +527,9 @@ class Société:
         logging.info("Simulation terminée.")
 
 async def main():
+    configure_logging()
     société = Société()
     await société.simuler()
 
-asyncio.run(main())
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -56,6 +56,7 @@ class CausalityModel:
             print(f"Système politique: {self.political_system.internal_state:.2f}")
             print(f"Système économique: {self.economic_system.internal_state:.2f}")
 
-# Lancer la simulation de causalité structurelle
-causality_model = CausalityModel()
-causality_model.run_simulation()
\ No newline at end of file
+if __name__ == "__main__":
+    # Lancer la simulation de causalité structurelle
+    causality_model = CausalityModel()
+    causality_model.run_simulation()
\ No newline at end of file
@@ -3,7 +3,8 @@ import random
 import logging
 
 # Setup enhanced logging
-logging.basicConfig(level=logging.DEBUG, filename='data_privacy_simulation.log', filemode='a', format='%(message)s')
+def configure_logging():
+    logging.basicConfig(level=logging.DEBUG, filename='data_privacy_simulation.log', filemode='a', format='%(message)s')
 
 # Constants
 COMPLEXITY_MIN = 1
@@ -219,7 +220,9 @@ class DataPrivacySociety:
 
 
 async def main():
+    configure_logging()
     society = DataPrivacySociety()
     await society.simulate()
 
-asyncio.run(main())
\ No newline at end of file
+if __name__ == "__main__":
+    asyncio.run(main())
\ No newline at end of file
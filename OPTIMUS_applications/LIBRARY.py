@@ -79,6 +79,7 @@ class Bibliothèque:
             # Incrémenter le compteur d'itérations
             self.iterations += 1
 
-# Simulation avec un intervalle de 1 seconde entre chaque itération
-bibliothèque = Bibliothèque()
-bibliothèque.simulate(max_iterations=200, interval=1)
+if __name__ == "__main__":
+    # Simulation avec un intervalle de 1 seconde entre chaque itération
+    bibliothèque = Bibliothèque()
+    bibliothèque.simulate(max_iterations=200, interval=1)
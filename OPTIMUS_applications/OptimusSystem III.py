@@ -8,7 +8,8 @@ import time
 import logging
 
 # Setup enhanced logging
-logging.basicConfig(level=logging.DEBUG, filename='optimuslatest6.log', filemode='a', format='%(message)s')
+def configure_logging():
+    logging.basicConfig(level=logging.DEBUG, filename='optimuslatest6.log', filemode='a', format='%(message)s')
 
 # Constants
 COMPLEXITY_MIN = 1
@@ -737,7 +738,9 @@ class Society:
         print(f"Society: {message}")
 
 async def main():
+    configure_logging()
     society = Society()
     await society.simulate()
 
-asyncio.run(main())
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -3,7 +3,8 @@ import random
 import logging
 
 # Configuration des logs pour tracer la simulation
-logging.basicConfig(level=logging.DEBUG, filename='admin_simulation.log', filemode='a', format='%(message)s')
+def configure_logging():
+    logging.basicConfig(level=logging.DEBUG, filename='admin_simulation.log', filemode='a', format='%(message)s')
 
 # Constantes de la simulation
 COMPLEXITY_MIN = 1
@@ -235,7 +236,9 @@ class FrenchAdministration:
 
 # Point d'entrée principal
 async def main():
+    configure_logging()
     administration = FrenchAdministration()
     await administration.simulate()
 
-asyncio.run(main())
\ No newline at end of file
+if __name__ == "__main__":
+    asyncio.run(main())
\ No newline at end of file
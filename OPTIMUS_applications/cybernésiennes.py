@@ -52,6 +52,7 @@ class Society:
                     self.individual.fulfilled = True
             time.sleep(1)  # Simulating the time loop between attempts
 
-# Run the simulation
-society = Society()
-society.simulate()
\ No newline at end of file
+if __name__ == "__main__":
+    # Run the simulation
+    society = Society()
+    society.simulate()
\ No newline at end of file
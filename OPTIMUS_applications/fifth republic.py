@@ -171,7 +171,8 @@ class FifthRepublic:
         # Time delay to simulate temporal evolution
         time.sleep(1)
 
-# Simulate the Fifth Republic government system
-fifth_republic = FifthRepublic()
-for _ in range(15):  # Simulate 15 cycles of government
-    fifth_republic.simulate_cycle()
\ No newline at end of file
+if __name__ == "__main__":
+    # Simulate the Fifth Republic government system
+    fifth_republic = FifthRepublic()
+    for _ in range(15):  # Simulate 15 cycles of government
+        fifth_republic.simulate_cycle()
\ No newline at end of file
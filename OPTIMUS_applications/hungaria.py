@@ -3,7 +3,8 @@ import asyncio
 import logging
 
 # Setup logging
-logging.basicConfig(level=logging.DEBUG, filename='hungarian_crisis.log', filemode='a', format='%(message)s')
+def configure_logging():
+    logging.basicConfig(level=logging.DEBUG, filename='hungarian_crisis.log', filemode='a', format='%(message)s')
 
 COMPLEXITY_MIN = 1
 COMPLEXITY_MAX = 10
@@ -137,7 +138,9 @@ class Society:
 
 # Running the simulation for the Hungarian model
 async def main():
+    configure_logging()
     society = Society()
     await society.simulate()
 
-asyncio.run(main())
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -86,6 +86,7 @@ class Society:
             # Pause pour simuler l'évolution dans le temps
             time.sleep(1)
 
-# Exécuter la simulation
-society = Society()
-society.simulate(10)
+if __name__ == "__main__":
+    # Exécuter la simulation
+    society = Society()
+    society.simulate(10)
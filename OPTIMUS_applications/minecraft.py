@@ -107,6 +107,7 @@ class Society:
             print(f"\n--- Iteration {i + 1} ---")
             self.iterate_generation()
 
-# Initialisation de la société et simulation
-society = Society()
-society.simulate()
\ No newline at end of file
+if __name__ == "__main__":
+    # Initialisation de la société et simulation
+    society = Society()
+    society.simulate()
\ No newline at end of file
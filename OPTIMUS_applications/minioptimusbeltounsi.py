@@ -3,7 +3,8 @@ import random
 import logging
 
 # I3dad es-sejellat b etfasil
-logging.basicConfig(level=logging.DEBUG, filename='mini_optimu2.log', filemode='a', format='%(message)s')
+def configure_logging():
+    logging.basicConfig(level=logging.DEBUG, filename='mini_optimu2.log', filemode='a', format='%(message)s')
 
 # ethawabet
 COMPLEXITY_MIN = 1  # A9all daraja s3ouba lel qanoun
@@ -134,7 +135,9 @@ class Society:
 
 # Tachghil el mo7akaa
 async def main():
+    configure_logging()
     society = Society()
     await society.simulate()
 
-asyncio.run(main())
+if __name__ == "__main__":
+    asyncio.run(main())
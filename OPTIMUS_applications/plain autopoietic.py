@@ -4,18 +4,6 @@ import matplotlib.pyplot as plt
 import numpy as np
 import logging
 
-# Set up logging
-logging.basicConfig(filename='autopoiesis3.log', 
-                    filemode='w',  # 'w' to overwrite the file each time; use 'a' to append
-                    format='%(asctime)s - %(levelname)s - %(message)s',
-                    level=logging.INFO)  # INFO level to capture standard logs
-
-# Example of logging different levels of information
-logging.info("Simulation started.")
-logging.error("An error occurred.")  # For any error logging
-logging.warning("This is a warning.")
-logging.debug("Debug information.")
-
 # Autopoietic System with sub-coalition dynamics, leadership changes, and crisis adaptation
 class AutopoieticSystem:
     def __init__(self, name, hierarchy_level, dependency_matrix):
@@ -331,9 +319,22 @@ class Society:
         plt.tight_layout()
         plt.show()
 
-# Initialize and run the fine-tuned simulation
-society = Society()
-society.simulate()
-
-# Plot the results
-society.plot_results()
\ No newline at end of file
+if __name__ == "__main__":
+    # Set up logging
+    logging.basicConfig(filename='autopoiesis3.log', 
+                        filemode='w',  # 'w' to overwrite the file each time; use 'a' to append
+                        format='%(asctime)s - %(levelname)s - %(message)s',
+                        level=logging.INFO)  # INFO level to capture standard logs
+
+    # Example of logging different levels of information
+    logging.info("Simulation started.")
+    logging.error("An error occurred.")  # For any error logging
+    logging.warning("This is a warning.")
+    logging.debug("Debug information.")
+
+    # Initialize and run the fine-tuned simulation
+    society = Society()
+    society.simulate()
+
+    # Plot the results
+    society.plot_results()
\ No newline at end of file
@@ -42,10 +42,11 @@ class Relationship:
             self.cycle += 1
             time.sleep(1)  # Simulates time in relationship cycles
 
-# Defining the partners with unique personalities and needs
-partner1 = Partner("Alex", "stability-seeking", "emotional security")
-partner2 = Partner("Taylor", "adventure-seeking", "intellectual connection")
+if __name__ == "__main__":
+    # Defining the partners with unique personalities and needs
+    partner1 = Partner("Alex", "stability-seeking", "emotional security")
+    partner2 = Partner("Taylor", "adventure-seeking", "intellectual connection")
 
-# Creating and evolving the relationship
-relationship = Relationship(partner1, partner2)
-relationship.evolve(10)
+    # Creating and evolving the relationship
+    relationship = Relationship(partner1, partner2)
+    relationship.evolve(10)
@@ -118,35 +118,36 @@ class Client:
         else:
             print(f"{self.nom} n'a pas pu payer.")
 
-# Initialisation du Franprix
-franprix = Franprix()
-
-# Ajouter des produits au stock avec un coût de restock
-franprix.ajouter_produit(Produit("Pomme", 1.5, 50, 0.8))
-franprix.ajouter_produit(Produit("Pain", 2.0, 30, 1.0))
-franprix.ajouter_produit(Produit("Lait", 1.0, 20, 0.5))
-franprix.ajouter_produit(Produit("zatla", 10, 15, 3))
-franprix.ajouter_produit(Produit("chorba", 3.5, 15, 2.5))
-franprix.ajouter_produit(Produit("kafteji", 3.5, 15, 2.5))
-franprix.ajouter_produit(Produit("mkhara9", 3.5, 15, 2.5))
-franprix.ajouter_produit(Produit("fricassé", 3.5, 15, 2.5))
-franprix.ajouter_produit(Produit("savon", 3.5, 15, 2.5))
-franprix.ajouter_produit(Produit("brosse à dent", 3.5, 15, 2.5))
-franprix.ajouter_produit(Produit("dentifrice", 3.5, 15, 2.5))
-franprix.ajouter_produit(Produit("cocaine", 90, 15, 40))
-
-# Ajouter des clients
-franprix.ajouter_client(Client("Alice", 100))
-franprix.ajouter_client(Client("Bob", 100))
-franprix.ajouter_client(Client("mustapha", 100))
-franprix.ajouter_client(Client("mohamed", 100))
-franprix.ajouter_client(Client("philippe", 100))
-franprix.ajouter_client(Client("khalil", 100))
-franprix.ajouter_client(Client("hamza", 100))
-franprix.ajouter_client(Client("zatlyboy", 100))
-franprix.ajouter_client(Client("aicha", 100))
-
-
-
-# Simuler le Franprix pendant 10 itérations
-franprix.simuler(200)
\ No newline at end of file
+if __name__ == "__main__":
+    # Initialisation du Franprix
+    franprix = Franprix()
+
+    # Ajouter des produits au stock avec un coût de restock
+    franprix.ajouter_produit(Produit("Pomme", 1.5, 50, 0.8))
+    franprix.ajouter_produit(Produit("Pain", 2.0, 30, 1.0))
+    franprix.ajouter_produit(Produit("Lait", 1.0, 20, 0.5))
+    franprix.ajouter_produit(Produit("zatla", 10, 15, 3))
+    franprix.ajouter_produit(Produit("chorba", 3.5, 15, 2.5))
+    franprix.ajouter_produit(Produit("kafteji", 3.5, 15, 2.5))
+    franprix.ajouter_produit(Produit("mkhara9", 3.5, 15, 2.5))
+    franprix.ajouter_produit(Produit("fricassé", 3.5, 15, 2.5))
+    franprix.ajouter_produit(Produit("savon", 3.5, 15, 2.5))
+    franprix.ajouter_produit(Produit("brosse à dent", 3.5, 15, 2.5))
+    franprix.ajouter_produit(Produit("dentifrice", 3.5, 15, 2.5))
+    franprix.ajouter_produit(Produit("cocaine", 90, 15, 40))
+
+    # Ajouter des clients
+    franprix.ajouter_client(Client("Alice", 100))
+    franprix.ajouter_client(Client("Bob", 100))
+    franprix.ajouter_client(Client("mustapha", 100))
+    franprix.ajouter_client(Client("mohamed", 100))
+    franprix.ajouter_client(Client("philippe", 100))
+    franprix.ajouter_client(Client("khalil", 100))
+    franprix.ajouter_client(Client("hamza", 100))
+    franprix.ajouter_client(Client("zatlyboy", 100))
+    franprix.ajouter_client(Client("aicha", 100))
+
+
+
+    # Simuler le Franprix pendant 10 itérations
+    franprix.simuler(200)
\ No newline at end of file
@@ -2,17 +2,18 @@ import asyncio
 import random
 import logging
 
-# Clear existing handlers to avoid duplication
-logging.getLogger().handlers = []
-
-# Setup logging to console only
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(message)s',
-    handlers=[
-        logging.StreamHandler()
-    ]
-)
+def configure_logging():
+    # Clear existing handlers to avoid duplication
+    logging.getLogger().handlers = []
+
+    # Setup logging to console only
+    logging.basicConfig(
+        level=logging.DEBUG,
+        format='%(message)s',
+        handlers=[
+            logging.StreamHandler()
+        ]
+    )
 
 # Constants
 COMPLEXITY_MIN = 1
@@ -131,7 +132,9 @@ class Society:
         logging.info("Simulation completed.")
 
 async def main():
+    configure_logging()
     society = Society()
     await society.simulate()
 
-asyncio.run(main())
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -106,4 +106,5 @@ async def main():
 
 
 # Exécution du programme
-asyncio.run(main())
\ No newline at end of file
+if __name__ == "__main__":
+    asyncio.run(main())
\ No newline at end of file
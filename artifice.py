@@ -4,7 +4,8 @@ import logging
 import matplotlib.pyplot as plt
 
 # Setup enhanced logging
-logging.basicConfig(level=logging.DEBUG, filename='mini_optimus.log', filemode='a', format='%(message)s')
+def configure_logging():
+    logging.basicConfig(level=logging.DEBUG, filename='mini_optimus.log', filemode='a', format='%(message)s')
 
 # Constants
 COMPLEXITY_MIN = 1
@@ -163,8 +164,10 @@ class JudicialSystem:
 
 # Main function to run the simulation
 async def main():
+    configure_logging()
     society = Society()
     await society.simulate()
 
 # Run the simulation
-asyncio.run(main())
\ No newline at end of file
+if __name__ == "__main__":
+    asyncio.run(main())
\ No newline at end of file
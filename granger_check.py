@@ -0,0 +1,40 @@
+"""Accuracy check of the online Granger tests on a long run.
+
+    python granger_check.py [--days N] [--seed S] [--tolerance REL]
+
+Simulates one headless Society, then compares the F-statistics that RunningGranger
+updated day by day with granger_tests run on the recorded history. Exits with status 1
+when a lag differs by more than the relative tolerance.
+"""
+import argparse
+import asyncio
+import sys
+
+import numpy as np
+
+import optimus
+
+def compare(days=5000, seed=1, max_lag=10):
+    """Online and end-of-run F-statistics per lag, and their relative difference."""
+    optimus.quiet_mode()
+    society = optimus.Society(seed=seed, config=optimus.SimulationConfig(simulation_days=days),
+                              clock=optimus.VirtualClock(), headless=True)
+    asyncio.run(society.simulate())
+    online = society.granger.ftest()[0]
+    batch = optimus.granger_tests(society.normative_inflation_history, society.caseload_history, max_lag)[0]
+    return online, batch, np.abs(online - batch) / np.abs(batch)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--days", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--tolerance", type=float, default=1e-6)
+    args = parser.parse_args(argv)
+    online, batch, errors = compare(args.days, args.seed)
+    for lag, (online_f, batch_f, error) in enumerate(zip(online, batch, errors), 1):
+        status = "ok" if error <= args.tolerance else "OFF"
+        print(f"lag {lag:2d}: online F {online_f:.6g}, granger_tests F {batch_f:.6g}, relative error {error:.1e} {status}")
+    return 1 if np.any(errors > args.tolerance) else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+"""Import-time benchmark for the simulation entry points.
+
+    python import_benchmark.py [--repeat N] [--budget SECONDS]
+
+Each file is loaded in a fresh interpreter (best of N runs), the way a worker process
+would load it, and the heavy analysis, plotting and dashboard packages it pulled in are
+listed. Exits with status 1 when a file goes over its startup budget.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# File -> startup budget in seconds
+BUDGETS = {
+    "optimus.py": 0.5,
+    "optimus_dash.py": 0.5,
+}
+HEAVY_MODULES = ["statsmodels", "scipy", "matplotlib", "pandas", "dash", "plotly", "networkx"]
+
+PROBE = """
+import importlib.util, json, sys, time
+start = time.perf_counter()
+spec = importlib.util.spec_from_file_location("probe", sys.argv[1])
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+seconds = time.perf_counter() - start
+heavy = [name for name in json.loads(sys.argv[2]) if name in sys.modules]
+print(json.dumps({"seconds": seconds, "heavy": heavy}))
+"""
+
+def measure(path, repeat=5):
+    """Best-of-`repeat` load time of `path` in a fresh interpreter, and the heavy modules it imported."""
+    best = None
+    # Run from a scratch directory: some scripts still open their journal files on import
+    with tempfile.TemporaryDirectory() as scratch:
+        for _ in range(repeat):
+            output = subprocess.run([sys.executable, "-c", PROBE, path, json.dumps(HEAVY_MODULES)], cwd=scratch,
+                                    capture_output=True, text=True, check=True).stdout
+            result = json.loads(output.strip().splitlines()[-1])
+            if best is None or result["seconds"] < best["seconds"]:
+                best = result
+    return best
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget", type=float, help="Override every per-file budget (seconds)")
+    args = parser.parse_args(argv)
+    over_budget = False
+    for name, budget in BUDGETS.items():
+        budget = args.budget if args.budget is not None else budget
+        result = measure(os.path.join(HERE, name), args.repeat)
+        status = "ok" if result["seconds"] <= budget else "OVER BUDGET"
+        over_budget |= result["seconds"] > budget
+        print(f"{name}: {result['seconds'] * 1000:.1f} ms (budget {budget * 1000:.0f} ms) {status}")
+        if result["heavy"]:
+            print(f"    heavy modules loaded at import: {', '.join(result['heavy'])}")
+    return 1 if over_budget else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
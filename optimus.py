@@ -0,0 +1,3148 @@
+import asyncio
+import numpy as np
+import itertools
+import random
+import time
+import logging
+import gzip
+import hashlib
+import heapq
+import json
+import os
+import queue
+import sys
+import threading
+import traceback
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, fields, replace
+
+_JOURNAL_STOP = object()
+
+class JournalWriter(logging.Handler):
+    """Logging handler that writes the Journal Officiel from a background thread.
+
+    The simulation thread only formats each record and puts it on a queue; the
+    writer thread drains the queue in batches and writes them to every target.
+    Targets are file paths, optionally gzip- or zstd-compressed and rotated once
+    they exceed `max_bytes` on disk, or text streams such as sys.stderr. Compressed
+    sizes are only known once a batch has been written, so those files are flushed
+    after each batch and rotated after the batch that takes them past `max_bytes`.
+    """
+
+    def __init__(self, targets, compression=None, max_bytes=None, backup_count=5, batch_size=4096, buffer_size=1 << 20):
+        super().__init__()
+        if compression not in (None, 'gzip', 'zstd'):
+            raise ValueError(f"Unsupported journal compression: {compression}")
+        self.compression = compression
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.batch_size = batch_size
+        self.buffer_size = buffer_size
+        self._files = []
+        self._streams = []
+        for target in targets:
+            if isinstance(target, str):
+                path = target + {'gzip': '.gz', 'zstd': '.zst'}.get(compression, '')
+                self._files.append({'path': path, 'file': self._open(path), 'start': os.path.getsize(path), 'size': 0})
+            else:
+                self._streams.append(target)
+        self._queue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._write_loop, name="JournalWriter", daemon=True)
+        self._thread.start()
+
+    def _open(self, path):
+        if self.compression == 'gzip':
+            return gzip.open(path, 'ab')
+        if self.compression == 'zstd':
+            import zstandard  # Dépendance optionnelle, seulement pour les journaux zstd
+            return zstandard.ZstdCompressor().stream_writer(open(path, 'ab'), closefd=True)
+        return open(path, 'ab', buffering=self.buffer_size)
+
+    def _rotate(self, journal):
+        journal['file'].close()
+        path = journal['path']
+        for index in range(self.backup_count - 1, 0, -1):
+            if os.path.exists(f"{path}.{index}"):
+                os.replace(f"{path}.{index}", f"{path}.{index + 1}")
+        if self.backup_count > 0:
+            os.replace(path, f"{path}.1")
+        else:
+            os.remove(path)
+        journal['file'] = self._open(path)
+        journal['start'] = journal['size'] = 0
+
+    def _disk_size(self, journal):
+        """Bytes of the journal file on disk, as of the last flush for compressed files."""
+        if self.compression == 'gzip':
+            return journal['file'].fileobj.tell()  # Opened for append, so this counts the earlier members too
+        if self.compression == 'zstd':
+            return journal['start'] + journal['file'].tell()
+        return journal['start'] + journal['size']
+
+    def _write_batch(self, lines):
+        text = "\n".join(lines) + "\n"
+        data = text.encode('utf-8')
+        incoming = 0 if self.compression else len(data)  # Compressed length unknown until written
+        for journal in self._files:
+            size = self._disk_size(journal)
+            if self.max_bytes and size and size + incoming > self.max_bytes:
+                self._rotate(journal)
+            journal['file'].write(data)
+            journal['size'] += len(data)
+            if self.max_bytes and self.compression:
+                journal['file'].flush()
+        for stream in self._streams:
+            stream.write(text)
+
+    def _flush_targets(self):
+        for journal in self._files:
+            journal['file'].flush()
+        for stream in self._streams:
+            stream.flush()
+
+    def _write_loop(self):
+        while True:
+            lines, flush_requests, stopping = [], [], False
+            item = self._queue.get()
+            while True:
+                if item is _JOURNAL_STOP:
+                    stopping = True
+                elif isinstance(item, threading.Event):
+                    flush_requests.append(item)
+                else:
+                    lines.append(item)
+                if stopping or len(lines) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            try:
+                if lines:
+                    self._write_batch(lines)
+                if flush_requests or stopping:
+                    self._flush_targets()
+            except Exception:
+                if logging.raiseExceptions:
+                    traceback.print_exc(file=sys.stderr)
+            for flushed in flush_requests:
+                flushed.set()
+            if stopping:
+                for journal in self._files:
+                    journal['file'].close()
+                return
+
+    def emit(self, record):
+        try:
+            self._queue.put(self.format(record))
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        """Block until every record queued so far has been written out."""
+        if self._thread.is_alive():
+            flushed = threading.Event()
+            self._queue.put(flushed)
+            flushed.wait()
+
+    def close(self):
+        if self._thread.is_alive():
+            self._queue.put(_JOURNAL_STOP)
+            self._thread.join()
+        super().close()
+
+def flush_journal():
+    """Flush every handler of the root logger, waiting for asynchronous journal writers to drain."""
+    for handler in logging.getLogger().handlers:
+        handler.flush()
+
+# Configuration globale du logger
+def configure_logger(async_journal=False, compression=None, max_bytes=None, directory="."):
+    """Route the root logger to the two Journal Officiel files (in `directory`) and the terminal.
+
+    Called by main() and the command line; importing the module leaves logging untouched.
+    """
+    logger = logging.getLogger()
+    logger.setLevel(logging.DEBUG)
+    logging.getLogger('matplotlib').setLevel(logging.WARNING)  # Keep font lookups out of the journals
+
+    # Supprimer tous les handlers existants pour éviter la duplication
+    if logger.hasHandlers():
+        for handler in logger.handlers[:]:
+            logger.removeHandler(handler)
+            handler.close()
+
+    if async_journal:
+        # Un seul handler asynchrone pour les deux journaux et le terminal
+        journal_writer = JournalWriter([os.path.join(directory, 'journalofficiel2024.log'),
+                                        os.path.join(directory, 'OFFICIALJOURNAL2.log'), sys.stderr],
+                                       compression=compression, max_bytes=max_bytes)
+        journal_writer.setFormatter(logging.Formatter('%(message)s'))
+        logger.addHandler(journal_writer)
+        logger.info("Logger configuration complete with asynchronous journal writer.")
+        return
+
+    # Handler pour le fichier
+    file_handler = logging.FileHandler(os.path.join(directory, 'journalofficiel2024.log'), 'a')
+    file_handler.setLevel(logging.DEBUG)
+    file_formatter = logging.Formatter('%(message)s')
+    file_handler.setFormatter(file_formatter)
+    logger.addHandler(file_handler)
+
+    # Handler pour le terminal
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(logging.DEBUG)
+    console_formatter = logging.Formatter('%(message)s')
+    console_handler.setFormatter(console_formatter)
+    logger.addHandler(console_handler)
+
+    logger.info("Logger configuration complete without duplication.")
+
+    # Ajout d'une configuration distincte pour enregistrer dans un autre fichier
+    file_specific_handler = logging.FileHandler(os.path.join(directory, 'OFFICIALJOURNAL2.log'), 'a')
+    file_specific_handler.setLevel(logging.DEBUG)
+    file_specific_formatter = logging.Formatter('%(message)s')
+    file_specific_handler.setFormatter(file_specific_formatter)
+    logger.addHandler(file_specific_handler)
+
+# Un logger par sous-système ; les messages remontent aux handlers du logger racine
+political_logger = logging.getLogger('optimus.political')
+judicial_logger = logging.getLogger('optimus.judicial')
+society_logger = logging.getLogger('optimus.society')
+SUBSYSTEM_LOGGERS = {'political': political_logger, 'judicial': judicial_logger, 'society': society_logger}
+
+def set_verbosity(level=None, **levels):
+    """Set the log level of every subsystem, or of some of them (political=, judicial=, society=).
+
+    Messages below a subsystem's level are dropped before their text is ever built.
+    """
+    unknown = set(levels) - set(SUBSYSTEM_LOGGERS)
+    if unknown:
+        raise ValueError(f"Unknown subsystems: {sorted(unknown)}")
+    for name, subsystem_logger in SUBSYSTEM_LOGGERS.items():
+        subsystem_level = levels.get(name, level)
+        if subsystem_level is not None:
+            subsystem_logger.setLevel(subsystem_level)
+
+def quiet_mode():
+    """Benchmark mode: only warnings and errors are logged, so hot paths skip message construction."""
+    set_verbosity(logging.WARNING)
+
+# Constants
+COMPLEXITY_MIN = 1
+COMPLEXITY_MAX = 10
+CITIZEN_PRESSURE_MIN = 1
+CITIZEN_PRESSURE_MAX = 10
+SIMULATION_DAYS = 365
+MAX_CASSATIONS = 3
+
+@dataclass(frozen=True)
+class SimulationConfig:
+    """Tunable parameters of a run; defaults reproduce the module constants above."""
+    complexity_min: int = COMPLEXITY_MIN
+    complexity_max: int = COMPLEXITY_MAX
+    citizen_pressure_min: int = CITIZEN_PRESSURE_MIN
+    citizen_pressure_max: int = CITIZEN_PRESSURE_MAX
+    simulation_days: int = SIMULATION_DAYS
+    max_cassations: int = MAX_CASSATIONS
+    reform_probability: float = 0.1
+    veto_period: int = 15
+    cases_per_day: int = 1
+    case_sampling: str = "uniform"  # or "complexity": norms drawn in proportion to their complexity
+    complexity_drift: int = 0  # Each day every norm's complexity moves by up to +/- this much (0 = never)
+    # Court capacities (cases heard at once) and mean hearing times in days, for the scheduled court mode
+    first_instance_capacity: int = 5
+    appeal_capacity: int = 3
+    cassation_capacity: int = 1
+    first_instance_service_days: float = 1.0
+    appeal_service_days: float = 2.0
+    cassation_service_days: float = 4.0
+    # Precedent reuse: a case rejected at first instance is settled by its `precedent_neighbours` most similar
+    # earlier decisions when at least `precedent_agreement` of them agree (0 neighbours = never)
+    precedent_neighbours: int = 0
+    precedent_agreement: float = 0.8
+
+    def __post_init__(self):
+        if self.complexity_min > self.complexity_max:
+            raise ValueError("complexity_min must not exceed complexity_max")
+        if self.citizen_pressure_min > self.citizen_pressure_max:
+            raise ValueError("citizen_pressure_min must not exceed citizen_pressure_max")
+        if self.veto_period < 1:
+            raise ValueError("veto_period must be at least 1")
+        if self.cases_per_day < 0:
+            raise ValueError("cases_per_day must not be negative")
+        if self.case_sampling not in ("uniform", "complexity"):
+            raise ValueError("case_sampling must be 'uniform' or 'complexity'")
+        if self.case_sampling == "complexity" and self.complexity_min < 1:
+            raise ValueError("complexity sampling needs complexity_min of at least 1")
+        if self.complexity_drift < 0:
+            raise ValueError("complexity_drift must not be negative")
+        if min(self.first_instance_capacity, self.appeal_capacity, self.cassation_capacity) < 1:
+            raise ValueError("court capacities must be at least 1")
+        if self.precedent_neighbours < 0:
+            raise ValueError("precedent_neighbours must not be negative")
+        if not 0.5 < self.precedent_agreement <= 1.0:
+            raise ValueError("precedent_agreement must be in (0.5, 1]")
+
+class RandomStreams:
+    """Independent random.Random / NumPy Generator pair backed by a SeedSequence.
+
+    Child streams come from spawned SeedSequences, so every component of a
+    Society draws from its own reproducible stream and concurrent societies
+    never share state.
+    """
+
+    def __init__(self, seed=None):
+        if isinstance(seed, np.random.SeedSequence):
+            self.seed_sequence = seed
+        else:
+            self.seed_sequence = np.random.SeedSequence(seed)
+        python_sequence, numpy_sequence = self.seed_sequence.spawn(2)
+        self.random = random.Random(int(python_sequence.generate_state(1, dtype=np.uint64)[0]))
+        self.generator = np.random.default_rng(numpy_sequence)
+
+    def spawn(self, count):
+        return [RandomStreams(child) for child in self.seed_sequence.spawn(count)]
+
+def _stream_pair(streams):
+    """Fall back to the global generators for components built outside a Society."""
+    if streams is None:
+        return random, np.random.default_rng()
+    return streams.random, streams.generator
+
+class SimulationClock:
+    """Source of simulated time; `sleep` advances `now` by the given number of seconds."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    async def sleep(self, seconds):
+        raise NotImplementedError("Must be implemented by subclasses")
+
+class RealTimeClock(SimulationClock):
+    """Paces the simulation in wall-clock time, e.g. for the Dash demo."""
+
+    async def sleep(self, seconds):
+        self.now += seconds
+        await asyncio.sleep(seconds)
+
+class VirtualClock(SimulationClock):
+    """Fast-forward mode: time advances instantly so batch runs go at CPU speed."""
+
+    async def sleep(self, seconds):
+        self.now += seconds
+        await asyncio.sleep(0)  # Still yield so interleaved simulations make progress
+
+# Événements exogènes et pression citoyenne, tirés pour tout l'horizon d'un coup
+SCENARIO_EVENTS = ["Economic Boom", "Economic Crisis", "Social Movement", "Natural Disaster", "nek mochta t3awej",
+                   "mostfa", "elections", "covid-19"]
+# Event -> (low, high, sign) of the citizen pressure adjustment, drawn uniformly in [low, high]
+PRESSURE_ADJUSTMENTS = {
+    "Economic Boom": (1, 5, 1),
+    "Economic Crisis": (1, 5, -1),
+    "Social Movement": (2, 7, 1),
+    "Natural Disaster": (1, 3, 1),
+    "nek mochta t3awej": (2, 5, 1),
+}
+_SCENARIO_EVENT_CODES = {name: code for code, name in enumerate(SCENARIO_EVENTS)}
+
+class Scenario:
+    """Exogenous event and citizen pressure for every day of a run.
+
+    Day d (1-based) uses events[d - 1] and pressures[d - 1]. A Scenario is plain
+    arrays, so one instance can be handed to every member of an ensemble.
+    """
+
+    def __init__(self, events, pressures):
+        self.events = np.asarray(events, dtype=np.int8)
+        self.pressures = np.asarray(pressures, dtype=np.int64)
+        if self.events.shape != self.pressures.shape:
+            raise ValueError("events and pressures must cover the same days")
+
+    def digest(self):
+        """Hash of the events and pressures, the same in every process (used by run_key)."""
+        content = hashlib.sha256(self.events.astype('<i1').tobytes())
+        content.update(self.pressures.astype('<i8').tobytes())
+        return content.hexdigest()
+
+    @classmethod
+    def generate(cls, days, generator=None, config=None, fixed_events=None):
+        """Draw the whole horizon in one vectorized pass; fixed_events maps day -> event name."""
+        generator = generator if generator is not None else np.random.default_rng()
+        config = config if config is not None else SimulationConfig()
+        pressures = generator.integers(config.citizen_pressure_min, config.citizen_pressure_max, size=days, endpoint=True)
+        events = generator.integers(len(SCENARIO_EVENTS), size=days)
+        for day, event in (fixed_events or {}).items():
+            if not 1 <= day <= days:
+                raise ValueError(f"Scenario day {day} is outside the {days}-day horizon")
+            events[day - 1] = _SCENARIO_EVENT_CODES[event]
+        for event, (low, high, sign) in PRESSURE_ADJUSTMENTS.items():
+            days_with_event = events == _SCENARIO_EVENT_CODES[event]
+            pressures[days_with_event] += sign * generator.integers(low, high, size=int(days_with_event.sum()), endpoint=True)
+        return cls(events, pressures)
+
+    @classmethod
+    def load(cls, path, days, generator=None, config=None):
+        """Generate a scenario with the events scripted in `path` pinned to their days.
+
+        The file lists entries such as "covid-19 at day 80, elections at day 200",
+        separated by commas or newlines; '#' starts a comment.
+        """
+        fixed_events = {}
+        with open(path, encoding="utf-8") as scenario_file:
+            for line in scenario_file:
+                for entry in line.split('#', 1)[0].split(','):
+                    entry = entry.strip()
+                    if not entry:
+                        continue
+                    event, separator, day = entry.rpartition(" at day ")
+                    if not separator or event not in _SCENARIO_EVENT_CODES or not day.strip().isdigit():
+                        raise ValueError(f"Cannot parse scenario entry {entry!r}")
+                    fixed_events[int(day)] = event
+        return cls.generate(days, generator, config, fixed_events)
+
+    def event(self, day):
+        return SCENARIO_EVENTS[self.events[day - 1]]
+
+    def pressure(self, day):
+        return int(self.pressures[day - 1])
+
+    def __len__(self):
+        return len(self.events)
+
+# Journal Officiel structuré : un enregistrement binaire de largeur fixe par événement
+EVENT_TYPES = ["", "NORM_CREATED", "CONSTITUTIONALITY_CHECK", "LEGALITY_CHECK", "JUDGMENT", "PRECEDENT_SET",
+               "VETO", "ARTICLE_49_3", "CENSURE"]
+EVENT_ACTORS = ["", "PARLIAMENT", "GOVERNMENT", "PRESIDENT", "PRIME MINISTER", "JudicialSystem",
+                "First Instance", "Appeal", "Court of Cassation", "Constitutional Council"]
+EVENT_NORM_KINDS = ["", "Norm", "Law", "Regulation"]
+EVENT_CHECK_TYPES = ["", "CONTRÔLE DE CONSTITUTIONNALITÉ", "CONTRÔLE OBLIGATOIRE A PRIORI",
+                     "CONTRÔLE DE CONSTITUTIONNALITÉ OBLIGATOIRE A PRIORI", "CONTRÔLE DE CONSTITUTIONNALITÉ POST-VETO",
+                     "CONTRÔLE DE LÉGALITÉ", "CONTRÔLE DE LÉGALITÉ DU VETO"]
+EVENT_DTYPE = np.dtype([
+    ('day', '<i4'),
+    ('event', 'u1'),
+    ('actor', 'u1'),
+    ('kind', 'u1'),
+    ('subject', '<i8'),  # Norm id, or case id for judgments
+    ('related', '<i8'),  # Norm id of a judged case, case id of a precedent, veto regulation id; -1 if none
+    ('value', '<i2'),    # Validity, verdict or outcome (1 = valid/constitutional/accepted/censured)
+    ('detail', '<i2'),   # Complexity of a new norm, check type code, cassation round or 49.3 count
+])
+EVENT_LOG_MAGIC = b"OPTEVT01"
+_EVENT_CODES = {name: code for code, name in enumerate(EVENT_TYPES)}
+_ACTOR_CODES = {name: code for code, name in enumerate(EVENT_ACTORS)}
+_NORM_KIND_CODES = {name: code for code, name in enumerate(EVENT_NORM_KINDS)}
+_CHECK_TYPE_CODES = {name: code for code, name in enumerate(EVENT_CHECK_TYPES)}
+
+def _norm_kind_code(norm):
+    return _NORM_KIND_CODES.get(getattr(norm, 'kind', type(norm)).__name__, 0)
+
+class EventLog:
+    """Binary event stream written alongside the Journal Officiel.
+
+    The file starts with EVENT_LOG_MAGIC, a little-endian uint32 header length and a
+    JSON header holding the record layout and code tables, followed by fixed-width
+    EVENT_DTYPE records. Records are buffered as tuples and written in chunks.
+    """
+
+    def __init__(self, path, chunk_size=65536):
+        self.path = path
+        self.chunk_size = chunk_size
+        self.day = 0
+        self._pending = []
+        self._file = open(path, 'wb')
+        _write_records_header(self._file, EVENT_LOG_MAGIC, {
+            'dtype': EVENT_DTYPE.descr,
+            'events': EVENT_TYPES,
+            'actors': EVENT_ACTORS,
+            'kinds': EVENT_NORM_KINDS,
+            'check_types': EVENT_CHECK_TYPES,
+        })
+
+    def record(self, event, actor="", norm=None, subject=-1, related=-1, value=0, detail=0):
+        if norm is not None:
+            kind, subject = _norm_kind_code(norm), norm.id
+        else:
+            kind = 0
+        self._pending.append((self.day, _EVENT_CODES[event], _ACTOR_CODES.get(actor, 0), kind, subject, related, value, detail))
+        if len(self._pending) >= self.chunk_size:
+            self.flush()
+
+    def record_many(self, event, actor, subjects, related=-1, values=0, details=0, kind=""):
+        """Append one record per entry of `subjects`; the other fields broadcast."""
+        records = np.empty(len(subjects), dtype=EVENT_DTYPE)
+        records['day'] = self.day
+        records['event'] = _EVENT_CODES[event]
+        records['actor'] = _ACTOR_CODES.get(actor, 0)
+        records['kind'] = _NORM_KIND_CODES.get(kind, 0)
+        records['subject'] = subjects
+        records['related'] = related
+        records['value'] = values
+        records['detail'] = details
+        self._write_pending()
+        records.tofile(self._file)
+
+    def _write_pending(self):
+        if self._pending:
+            np.array(self._pending, dtype=EVENT_DTYPE).tofile(self._file)
+            self._pending.clear()
+
+    def flush(self):
+        self._write_pending()
+        self._file.flush()
+
+    def close(self):
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+def _write_records_header(record_file, magic, header):
+    header = json.dumps(header).encode('utf-8')
+    record_file.write(magic + len(header).to_bytes(4, 'little') + header)
+
+def _read_records(path, magic, description):
+    with open(path, 'rb') as record_file:
+        if record_file.read(len(magic)) != magic:
+            raise ValueError(f"{path} is not {description}")
+        header_length = int.from_bytes(record_file.read(4), 'little')
+        header = json.loads(record_file.read(header_length).decode('utf-8'))
+    dtype = np.dtype([tuple(field) for field in header['dtype']])
+    offset = len(magic) + 4 + header_length
+    if os.path.getsize(path) == offset:
+        return np.empty(0, dtype=dtype), header
+    return np.memmap(path, dtype=dtype, mode='r', offset=offset), header
+
+def read_event_log(path):
+    """Load an EventLog file as a memory-mapped EVENT_DTYPE array, with its header."""
+    return _read_records(path, EVENT_LOG_MAGIC, "an event log")
+
+def event_log_frame(path):
+    """Load an EventLog file as a pandas DataFrame with decoded categorical columns."""
+    import pandas as pd  # Optional dependency, only needed for post-hoc analysis
+
+    records, header = read_event_log(path)
+    frame = pd.DataFrame({name: np.asarray(records[name]) for name in records.dtype.names})
+    for column, table in (('event', 'events'), ('actor', 'actors'), ('kind', 'kinds')):
+        frame[column] = pd.Categorical.from_codes(frame[column], categories=header[table])
+    return frame
+
+# Archives : les affaires jugées et les normes abrogées quittent les structures actives
+ARCHIVE_MAGIC = b"OPTARC01"
+ARCHIVE_REASONS = ["", "abrogated", "dissolved", "new government"]
+_ARCHIVE_REASON_CODES = {name: code for code, name in enumerate(ARCHIVE_REASONS)}
+CASE_ARCHIVE_DTYPE = np.dtype([
+    ('day', '<i4'),
+    ('id', '<i8'),
+    ('norm_kind', 'u1'),
+    ('norm_id', '<i8'),
+    ('complexity', '<i2'),
+    ('constitutional', '?'),  # Verdict on the norm when the case was filed
+    ('accepted', '?'),
+    ('cassations', 'u1'),
+    ('sojourn', '<f4'),  # Days from filing to final judgment, 0 outside the scheduled court mode
+])
+VISIT_ARCHIVE_DTYPE = np.dtype([('day', '<i4'), ('stage', 'u1'), ('time', '<f4')])  # Stage index in COURT_STAGES
+NORM_ARCHIVE_DTYPE = np.dtype([
+    ('day', '<i4'),
+    ('kind', 'u1'),
+    ('id', '<i8'),
+    ('complexity', '<i2'),
+    ('valid', '?'),
+    ('reason', 'u1'),  # ARCHIVE_REASONS code
+])
+
+class Archive:
+    """Append-only table of retired records (a structured dtype whose first field is 'day').
+
+    Rows are buffered as tuples and sealed into NumPy chunks of chunk_size rows. After
+    spill_to(path), sealed chunks are appended to that file instead (ARCHIVE_MAGIC, JSON
+    header, fixed-width records, as for the EventLog), so at most one chunk stays in
+    memory. records() and find() read both back.
+    """
+
+    def __init__(self, dtype, chunk_size=4096):
+        self.dtype = np.dtype(dtype)
+        self.chunk_size = chunk_size
+        self.day = 0  # Day stamped on incoming rows, advanced by the Society
+        self.path = None
+        self._file = None
+        self._chunks = []
+        self._pending = []
+        self._size = 0
+
+    def spill_to(self, path):
+        """Move the archive to `path` and write every later chunk there."""
+        if self._file is not None:
+            raise ValueError(f"Archive already spills to {self.path}")
+        self.path = path
+        self._file = open(path, 'wb')
+        _write_records_header(self._file, ARCHIVE_MAGIC, {'dtype': self.dtype.descr})
+        for chunk in self._chunks:
+            chunk.tofile(self._file)
+        self._chunks.clear()
+
+    def append(self, *fields):
+        self._pending.append((self.day,) + fields)
+        self._size += 1
+        if len(self._pending) >= self.chunk_size:
+            self._seal()
+
+    def extend(self, count, **columns):
+        """Append `count` rows at once; the columns broadcast like EventLog.record_many."""
+        rows = np.zeros(count, dtype=self.dtype)
+        rows['day'] = self.day
+        for name, values in columns.items():
+            rows[name] = values
+        self._seal()
+        self._store(rows)
+        self._size += count
+
+    def _seal(self):
+        if self._pending:
+            self._store(np.array(self._pending, dtype=self.dtype))
+            self._pending.clear()
+
+    def _store(self, rows):
+        if self._file is not None:
+            rows.tofile(self._file)
+        else:
+            self._chunks.append(rows)
+
+    def flush(self):
+        self._seal()
+        if self._file is not None and not self._file.closed:
+            self._file.flush()
+
+    def close(self):
+        if self._file is not None and not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def chunks(self):
+        """Archived rows, oldest first, one chunk at a time; spilled rows are read from the file as needed."""
+        self.flush()
+        if self.path is not None:
+            spilled = read_archive(self.path)[0]
+            for start in range(0, len(spilled), self.chunk_size):
+                yield spilled[start:start + self.chunk_size]
+        yield from self._chunks
+
+    def _gather(self, parts):
+        parts = list(parts)
+        return np.concatenate(parts) if parts else np.empty(0, dtype=self.dtype)
+
+    def records(self):
+        """Every archived row, oldest first, as one in-memory array."""
+        return self._gather(self.chunks())
+
+    def column(self, name):
+        """One field of every archived row, oldest first."""
+        parts = [np.asarray(chunk[name]) for chunk in self.chunks()]
+        return np.concatenate(parts) if parts else np.empty(0, dtype=self.dtype[name])
+
+    def find(self, **fields):
+        """Archived rows whose fields equal the given values, e.g. find(id=12), filtered chunk by chunk."""
+        def matches(chunk):
+            mask = np.ones(len(chunk), dtype=np.bool_)
+            for name, value in fields.items():
+                mask &= chunk[name] == value
+            return np.asarray(chunk[mask])
+        return self._gather(matches(chunk) for chunk in self.chunks())
+
+    def nbytes(self):
+        """Memory held by the archive itself, spilled rows excluded."""
+        return sum(chunk.nbytes for chunk in self._chunks) + len(self._pending) * self.dtype.itemsize
+
+    def __len__(self):
+        return self._size
+
+def read_archive(path):
+    """Load an Archive file as a memory-mapped array, with its header."""
+    return _read_records(path, ARCHIVE_MAGIC, "an archive")
+
+HISTORY_SERIES = ("caseload", "normative_inflation", "temporal_gap", "judicial_decisions", "decisions")
+HISTORY_FIELDS = ["alive", "valid", "complexity", "text"]
+_HISTORY_FIELD_CODES = {name: code for code, name in enumerate(HISTORY_FIELDS)}
+HISTORY_DELTA_DTYPE = np.dtype([('day', '<i4'), ('kind', 'u1'), ('id', '<i8'), ('field', 'u1'), ('value', '<i8')])
+
+class HistoryRecorder:
+    """Columnar history of a run.
+
+    Per-day scalars go into preallocated NumPy series; norm state is kept as
+    (day, kind, id, field, value) deltas pushed by the norm pools, so memory grows
+    with the number of changes rather than with days x norms. state_at(day)
+    rebuilds the full norm state on demand. Being the full history, it is not
+    bounded: deltas and interned texts grow with every norm ever created or changed.
+    """
+
+    def __init__(self, days, chunk_size=65536):
+        self.days = 0
+        self.day = 0  # Day stamped on incoming deltas, advanced by the Society
+        self._series = {name: np.zeros(max(days, 1), dtype=np.int64) for name in HISTORY_SERIES}
+        self.decisions = []  # valid_rules only grows, so its prefix for each day is enough
+        self.texts = []
+        self._text_codes = {}
+        self.chunk_size = chunk_size
+        self._pending = []
+        self._deltas = [np.empty(0, dtype=HISTORY_DELTA_DTYPE)]  # Sealed chunks, merged when read
+
+    def record_day(self, caseload, normative_inflation, temporal_gap, judicial_decisions, valid_rules):
+        if self.days == len(self._series["caseload"]):
+            for name, series in self._series.items():
+                self._series[name] = np.concatenate([series, np.zeros(len(series), dtype=series.dtype)])
+        self.decisions.extend(valid_rules[len(self.decisions):])
+        for name, value in (("caseload", caseload), ("normative_inflation", normative_inflation),
+                            ("temporal_gap", temporal_gap), ("judicial_decisions", judicial_decisions),
+                            ("decisions", len(self.decisions))):
+            self._series[name][self.days] = value
+        self.days += 1
+
+    def __getitem__(self, name):
+        """The recorded part of a per-day series, e.g. history["caseload"]."""
+        return self._series[name][:self.days]
+
+    def _record(self, norm, field, value):
+        self._pending.append((self.day, _norm_kind_code(norm), norm.id, _HISTORY_FIELD_CODES[field], value))
+        if len(self._pending) >= self.chunk_size:
+            self._seal()
+
+    def _seal(self):
+        if self._pending:
+            self._deltas.append(np.array(self._pending, dtype=HISTORY_DELTA_DTYPE))
+            self._pending.clear()
+
+    def norm_added(self, norm):
+        text_code = self._text_codes.get(norm.text)
+        if text_code is None:
+            text_code = self._text_codes[norm.text] = len(self.texts)
+            self.texts.append(norm.text)
+        self._record(norm, "alive", 1)
+        self._record(norm, "valid", int(norm.valid))
+        self._record(norm, "complexity", norm.complexity)
+        self._record(norm, "text", text_code)
+
+    def norm_removed(self, norm):
+        self._record(norm, "alive", 0)
+
+    def norm_changed(self, norm, field, value):
+        self._record(norm, field, int(value))
+
+    def deltas(self):
+        """All norm-state deltas recorded so far, as a HISTORY_DELTA_DTYPE array in recording order."""
+        self._seal()
+        if len(self._deltas) > 1:
+            self._deltas = [np.concatenate(self._deltas)]
+        return self._deltas[0]
+
+    def decisions_at(self, day):
+        return self.decisions[:self._series["decisions"][day - 1]]
+
+    def state_at(self, day):
+        """Rebuild the norms in force at the end of `day` (1-based) as columns.
+
+        Returns {'kind', 'id', 'valid', 'complexity', 'text'}; kinds are EVENT_NORM_KINDS names.
+        """
+        deltas = self.deltas()
+        deltas = deltas[:np.searchsorted(deltas['day'], day, side='right')]
+        # Last value per (kind, id, field): stable sort by key, keep the final entry of each run
+        ordered = deltas[np.lexsort((deltas['field'], deltas['id'], deltas['kind']))]
+        last = np.ones(len(ordered), dtype=np.bool_)
+        last[:-1] = ((ordered['kind'][1:] != ordered['kind'][:-1]) | (ordered['id'][1:] != ordered['id'][:-1])
+                     | (ordered['field'][1:] != ordered['field'][:-1]))
+        latest = ordered[last]
+        values = {}
+        for field, code in _HISTORY_FIELD_CODES.items():
+            selected = latest[latest['field'] == code]
+            values[field] = dict(zip(zip(selected['kind'].tolist(), selected['id'].tolist()), selected['value'].tolist()))
+        norms = [key for key, alive in values["alive"].items() if alive]
+        return {
+            'kind': [EVENT_NORM_KINDS[kind] for kind, _ in norms],
+            'id': np.array([norm_id for _, norm_id in norms], dtype=np.int64),
+            'valid': np.array([values["valid"][key] for key in norms], dtype=np.bool_),
+            'complexity': np.array([values["complexity"][key] for key in norms], dtype=np.int64),
+            'text': [self.texts[values["text"][key]] for key in norms],
+        }
+
+class RunningCorrelation:
+    """Welford co-moments of several series, so Pearson correlations can be read after any day."""
+
+    def __init__(self, names):
+        self.names = tuple(names)
+        self._index = {name: index for index, name in enumerate(self.names)}
+        self.n = 0
+        self.mean = np.zeros(len(self.names))
+        self._comoment = np.zeros((len(self.names), len(self.names)))
+
+    def update(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        self.n += 1
+        delta = values - self.mean
+        self.mean += delta / self.n
+        self._comoment += np.outer(delta, values - self.mean)
+
+    def matrix(self):
+        """Pearson correlation matrix; NaN where a series has had no variance yet."""
+        scale = np.sqrt(np.diag(self._comoment))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return self._comoment / np.outer(scale, scale)
+
+    def pearson(self, first, second):
+        return float(self.matrix()[self._index[first], self._index[second]])
+
+class RunningGranger:
+    """Granger F-tests of `cause` -> `effect` for lags 1..max_lag, updated one day at a time.
+
+    Each lag keeps the triangular R factor of its design [1, effect lags, cause lags | effect],
+    updated by re-factoring R with the new day's row appended. Unlike the normal equations,
+    R keeps its accuracy on long runs of trending series. Reading the statistics solves the
+    restricted and unrestricted models against R. The sample for lag L starts at day L + 1,
+    as in statsmodels' ssr_ftest, so the numbers agree with the end-of-run test.
+    """
+
+    def __init__(self, max_lag=10):
+        self.max_lag = max_lag
+        self.n = 0
+        self._effect_lags = np.zeros(max_lag)  # Most recent day first
+        self._cause_lags = np.zeros(max_lag)
+        self._factors = [np.zeros((2 * lag + 2, 2 * lag + 2)) for lag in range(1, max_lag + 1)]
+        self._rows = np.zeros(max_lag, dtype=np.int64)  # Observations per lag
+
+    def update(self, effect, cause):
+        for lag, factor in enumerate(self._factors, 1):
+            if self.n >= lag:
+                row = np.concatenate(([1.0], self._effect_lags[:lag], self._cause_lags[:lag], [effect]))
+                self._factors[lag - 1] = np.linalg.qr(np.vstack((factor, row)), mode='r')
+                self._rows[lag - 1] += 1
+        self._effect_lags[1:] = self._effect_lags[:-1]
+        self._effect_lags[0] = effect
+        self._cause_lags[1:] = self._cause_lags[:-1]
+        self._cause_lags[0] = cause
+        self.n += 1
+
+    @staticmethod
+    def _ssr(factor, columns):
+        # R holds the same least-squares problem as the full design: |R[:, -1] - R[:, :columns] b|^2
+        design = factor[:, :columns]
+        residuals = factor[:, -1] - design @ np.linalg.lstsq(design, factor[:, -1], rcond=None)[0]
+        return residuals @ residuals, np.linalg.matrix_rank(design)
+
+    def ftest(self):
+        """Arrays (F, p-value, df_denom) indexed by lag - 1; NaN where the test is not yet defined."""
+        from scipy.stats import f as f_distribution
+        f_statistics = np.full(self.max_lag, np.nan)
+        df_denom = np.zeros(self.max_lag, dtype=np.int64)
+        for lag, factor in enumerate(self._factors, 1):
+            ssr_restricted, _ = self._ssr(factor, lag + 1)
+            ssr_joint, rank = self._ssr(factor, 2 * lag + 1)
+            df_denom[lag - 1] = self._rows[lag - 1] - rank
+            if df_denom[lag - 1] > 0 and ssr_joint > 0:
+                f_statistics[lag - 1] = (ssr_restricted - ssr_joint) / ssr_joint / lag * df_denom[lag - 1]
+        lags = np.arange(1, self.max_lag + 1)
+        return f_statistics, f_distribution.sf(f_statistics, lags, np.maximum(df_denom, 1)), df_denom
+
+def _batched_ssr(design, target):
+    """Residual sum of squares and rank of OLS fits stacked along the first axis (pinv, like statsmodels)."""
+    beta = np.linalg.pinv(design) @ target[..., None]
+    residuals = target - (design @ beta)[..., 0]
+    return np.einsum('...i,...i->...', residuals, residuals), np.linalg.matrix_rank(design)
+
+def granger_tests(effect, cause, max_lag=10):
+    """Granger F-tests of `cause` -> `effect` for every lag 1..max_lag and every ensemble member.
+
+    effect and cause are (day,) or (member x day) arrays. The lagged design is built once
+    for max_lag and sliced per lag; each lag is then one batched least-squares solve over
+    all members. Returns (F, p-value, df_denom) arrays shaped (member x lag), or (lag,)
+    for a single series; they match grangercausalitytests' ssr_ftest.
+    """
+    from scipy.stats import f as f_distribution
+    effect = np.asarray(effect, dtype=np.float64)
+    cause = np.asarray(cause, dtype=np.float64)
+    single = effect.ndim == 1
+    effect, cause = np.atleast_2d(effect), np.atleast_2d(cause)
+    members, days = effect.shape
+    if days <= 3 * max_lag + 1:
+        raise ValueError(f"Insufficient observations for {max_lag} lags: {days} days")
+    # lagged[..., t, j] is the series at day t - (j + 1); rows t < max_lag are only used by shorter lags
+    effect_lags = np.zeros((members, days, max_lag))
+    cause_lags = np.zeros((members, days, max_lag))
+    for j in range(max_lag):
+        effect_lags[:, j + 1:, j] = effect[:, :days - j - 1]
+        cause_lags[:, j + 1:, j] = cause[:, :days - j - 1]
+    f_statistics = np.full((members, max_lag), np.nan)
+    df_denom = np.zeros((members, max_lag), dtype=np.int64)
+    for lag in range(1, max_lag + 1):
+        target = effect[:, lag:]
+        constant = np.ones((members, days - lag, 1))
+        restricted = np.concatenate((effect_lags[:, lag:, :lag], constant), axis=2)
+        joint = np.concatenate((effect_lags[:, lag:, :lag], cause_lags[:, lag:, :lag], constant), axis=2)
+        ssr_restricted, _ = _batched_ssr(restricted, target)
+        ssr_joint, rank = _batched_ssr(joint, target)
+        df_denom[:, lag - 1] = days - lag - rank
+        with np.errstate(divide='ignore', invalid='ignore'):
+            f_statistics[:, lag - 1] = np.where(ssr_joint > 0, (ssr_restricted - ssr_joint) / ssr_joint / lag * df_denom[:, lag - 1], np.nan)
+    p_values = f_distribution.sf(f_statistics, np.arange(1, max_lag + 1), np.maximum(df_denom, 1))
+    if single:
+        return f_statistics[0], p_values[0], df_denom[0]
+    return f_statistics, p_values, df_denom
+
+class Norm:
+    def __init__(self, norm_id, text, valid, complexity, norm_type="ordinaire"):
+        self.id = norm_id
+        self.text = text
+        self.valid = valid
+        self.complexity = complexity
+        self.norm_type = norm_type
+        self.history = []
+        political_logger.info("Norm %s: Initialized with complexity %s and validity %s", self.id, complexity, valid)
+
+    def update_complexity(self, adjustment):
+        old_complexity = self.complexity
+        self.complexity = max(COMPLEXITY_MIN, min(COMPLEXITY_MAX, self.complexity + adjustment))
+        political_logger.info("Norm %s: Updated complexity from %s to %s", self.id, old_complexity, self.complexity)
+        self.history.append(('complexity', self.complexity, time.time()))
+
+    def invalidate(self):
+        self.valid = False
+        political_logger.info("Norm %s: Invalidated", self.id)
+        self.history.append(('valid', self.valid, time.time()))
+
+    def validate(self):
+        self.valid = True
+        political_logger.info("Norm %s: Validated", self.id)
+        self.history.append(('valid', self.valid, time.time()))
+
+    def get_history(self):
+        political_logger.info("Norm %s: Getting history", self.id)
+        return self.history
+
+    def __str__(self):
+        return f"Norm(id={self.id}, text={self.text}, valid={self.valid}, complexity={self.complexity})"
+
+class Law(Norm):
+    pass
+
+class Regulation(Norm):
+    pass
+
+class NormRegistry:
+    """Pool of norms indexed by id and by norm type, kept in insertion order."""
+
+    def __init__(self, norms=()):
+        self._by_id = {}
+        self._by_type = {}
+        self._by_text = {}
+        self._dense = []  # Dense array for uniform sampling, compacted by swap-remove
+        self._slot = {}
+        self.listener = None  # e.g. a HistoryRecorder, told about every add, remove and change
+        for norm in norms:
+            self.add(norm)
+
+    def add(self, norm):
+        if norm.id in self._by_id:
+            raise KeyError(f"Norm {norm.id} is already registered")
+        self._by_id[norm.id] = norm
+        self._by_type.setdefault(norm.norm_type, {})[norm.id] = norm
+        self._by_text.setdefault(norm.text, {})[norm.id] = norm
+        self._slot[norm.id] = len(self._dense)
+        self._dense.append(norm)
+        if self.listener is not None:
+            self.listener.norm_added(norm)
+
+    def extend(self, norms):
+        for norm in norms:
+            self.add(norm)
+
+    def remove(self, norm):
+        if self._by_id.get(norm.id) is not norm:
+            raise KeyError(f"Norm {norm.id} is not registered")
+        del self._by_id[norm.id]
+        bucket = self._by_type[norm.norm_type]
+        del bucket[norm.id]
+        if not bucket:
+            del self._by_type[norm.norm_type]
+        bucket = self._by_text[norm.text]
+        del bucket[norm.id]
+        if not bucket:
+            del self._by_text[norm.text]
+        slot = self._slot.pop(norm.id)
+        last = self._dense.pop()
+        if last is not norm:
+            self._dense[slot] = last
+            self._slot[last.id] = slot
+        if self.listener is not None:
+            self.listener.norm_removed(norm)
+
+    def get(self, norm_id, default=None):
+        return self._by_id.get(norm_id, default)
+
+    def of_type(self, norm_type):
+        return list(self._by_type.get(norm_type, {}).values())
+
+    def with_text(self, text):
+        return list(self._by_text.get(text, {}).values())
+
+    def latest(self, count):
+        """Return the `count` most recently registered norms, oldest first."""
+        norms = list(itertools.islice(reversed(self._by_id.values()), count))
+        norms.reverse()
+        return norms
+
+    def sample(self, rng=random):
+        """Draw one norm uniformly at random; raises IndexError when empty, like random.choice."""
+        return rng.choice(self._dense)
+
+    def at(self, slot):
+        """Norm at a dense sampling slot, 0 <= slot < len(self); slots move on removal."""
+        return self._dense[slot]
+
+    def adjust_complexity(self, adjustment, low=COMPLEXITY_MIN, high=COMPLEXITY_MAX):
+        """NormStore.adjust_complexity over every norm, in insertion order; `adjustment` is one value or one per norm."""
+        adjustments = np.broadcast_to(adjustment, len(self._by_id)).tolist()
+        for norm, change in zip(list(self._by_id.values()), adjustments):
+            complexity = max(low, min(high, norm.complexity + change))
+            if complexity != norm.complexity:
+                norm.complexity = complexity
+                self.record_change(norm, "complexity", complexity)
+
+    def record_change(self, norm, field, value):
+        if self.listener is not None:
+            self.listener.norm_changed(norm, field, value)
+
+    def compact(self, force=False):
+        """Nothing to reclaim: removed norms are dropped at once. Here for parity with NormStore."""
+
+    def clear(self):
+        if self.listener is not None:
+            for norm in self:
+                self.listener.norm_removed(norm)
+        self._by_id.clear()
+        self._by_type.clear()
+        self._by_text.clear()
+        self._dense.clear()
+        self._slot.clear()
+
+    def __contains__(self, norm_id):
+        return norm_id in self._by_id
+
+    def __iter__(self):
+        return iter(self._by_id.values())
+
+    def __len__(self):
+        return len(self._by_id)
+
+class NormView:
+    """Lightweight Norm-compatible view onto one row of a NormStore.
+
+    Views are made afresh by every lookup, so attributes beyond the Norm fields (e.g.
+    adopted_without_vote) are kept by the store, per row, where every view sees them.
+    """
+    __slots__ = ('_store', '_row')
+
+    def __init__(self, store, row):
+        self._store = store
+        self._row = row
+
+    def __setattr__(self, name, value):
+        if name in NormView.__slots__ or hasattr(type(self), name):
+            object.__setattr__(self, name, value)
+        else:
+            self._store.attributes.setdefault(self._row, {})[name] = value
+
+    def __getattr__(self, name):
+        if name in NormView.__slots__:
+            raise AttributeError(name)
+        try:
+            return self._store.attributes[self._row][name]
+        except KeyError:
+            raise AttributeError(f"{type(self).__name__} object has no attribute {name!r}") from None
+
+    @property
+    def id(self):
+        return int(self._store.ids[self._row])
+
+    @property
+    def text(self):
+        return self._store.texts[self._store.text_codes[self._row]]
+
+    @property
+    def valid(self):
+        return bool(self._store.valid[self._row])
+
+    @valid.setter
+    def valid(self, value):
+        self._store.valid[self._row] = value
+
+    @property
+    def complexity(self):
+        return int(self._store.complexity[self._row])
+
+    @complexity.setter
+    def complexity(self, value):
+        self._store.complexity[self._row] = value
+
+    @property
+    def norm_type(self):
+        return self._store.norm_types[self._store.norm_type_codes[self._row]]
+
+    @property
+    def history(self):
+        return self._store.histories.setdefault(self._row, [])
+
+_NORM_VIEW_CLASSES = {}
+_NORM_FIELDS = {'id', 'text', 'valid', 'complexity', 'norm_type', 'history'}
+
+def norm_view_class(kind):
+    """Return the view class for a norm kind, so isinstance(view, Law) keeps working."""
+    if kind not in _NORM_VIEW_CLASSES:
+        _NORM_VIEW_CLASSES[kind] = type(f"Stored{kind.__name__}", (NormView, kind), {'__slots__': (), 'kind': kind})
+    return _NORM_VIEW_CLASSES[kind]
+
+class NormStore:
+    """Columnar (struct-of-arrays) drop-in replacement for NormRegistry.
+
+    Each added norm is copied into NumPy columns and its text is interned, so the
+    pool holds no per-norm Python objects; get/sample/iteration hand out NormView
+    instances. Removed rows are reclaimed by compact() or clear().
+    """
+
+    def __init__(self, norms=(), capacity=1024):
+        self.ids = np.empty(capacity, dtype=np.int64)
+        self.kind_codes = np.empty(capacity, dtype=np.int8)
+        self.valid = np.empty(capacity, dtype=np.bool_)
+        self.complexity = np.empty(capacity, dtype=np.int16)
+        self.norm_type_codes = np.empty(capacity, dtype=np.int16)
+        self.text_codes = np.empty(capacity, dtype=np.int32)
+        self.alive = np.zeros(capacity, dtype=np.bool_)
+        self.texts = []
+        self._text_codes = {}
+        self.norm_types = []
+        self._norm_type_codes = {}
+        self.kinds = []
+        self._kind_codes = {}
+        self.histories = {}
+        self.attributes = {}  # Row -> extra attributes set on its views
+        # Live rows of each text as a doubly linked list in insertion order: head and tail per
+        # text code, neighbours per row, so texts need no per-text container
+        self._text_first = np.full(capacity, -1, dtype=np.int64)
+        self._text_last = np.full(capacity, -1, dtype=np.int64)
+        self._next_same_text = np.empty(capacity, dtype=np.int64)
+        self._previous_same_text = np.empty(capacity, dtype=np.int64)
+        self._size = 0
+        self._count = 0
+        self._row_of_id = np.full(capacity, -1, dtype=np.int64)
+        self._dense = np.empty(capacity, dtype=np.int64)  # Live rows, compacted by swap-remove for sampling
+        self._slot = np.empty(capacity, dtype=np.int64)
+        self.listener = None
+        for norm in norms:
+            self.add(norm)
+
+    @staticmethod
+    def _intern(value, table, codes):
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(table)
+            table.append(value)
+        return code
+
+    @staticmethod
+    def _grown(array, size, fill=None):
+        new_array = np.empty(size, dtype=array.dtype) if fill is None else np.full(size, fill, dtype=array.dtype)
+        new_array[:len(array)] = array
+        return new_array
+
+    def _reserve(self, rows):
+        if rows > len(self.ids):
+            size = max(rows, 2 * len(self.ids))
+            for column in ('ids', 'kind_codes', 'valid', 'complexity', 'norm_type_codes', 'text_codes', '_dense', '_slot',
+                           '_next_same_text', '_previous_same_text'):
+                setattr(self, column, self._grown(getattr(self, column), size))
+            self.alive = self._grown(self.alive, size, False)
+
+    def _row(self, norm_id):
+        if 0 <= norm_id < len(self._row_of_id):
+            return int(self._row_of_id[norm_id])
+        return -1
+
+    def _link_text(self, row, text_code):
+        if text_code >= len(self._text_first):
+            size = max(text_code + 1, 2 * len(self._text_first))
+            self._text_first = self._grown(self._text_first, size, -1)
+            self._text_last = self._grown(self._text_last, size, -1)
+        previous = self._text_last[text_code]
+        self._previous_same_text[row] = previous
+        self._next_same_text[row] = -1
+        if previous >= 0:
+            self._next_same_text[previous] = row
+        else:
+            self._text_first[text_code] = row
+        self._text_last[text_code] = row
+
+    def _unlink_text(self, row, text_code):
+        previous, following = self._previous_same_text[row], self._next_same_text[row]
+        if previous >= 0:
+            self._next_same_text[previous] = following
+        else:
+            self._text_first[text_code] = following
+        if following >= 0:
+            self._previous_same_text[following] = previous
+        else:
+            self._text_last[text_code] = previous
+
+    def _view(self, row):
+        return norm_view_class(self.kinds[self.kind_codes[row]])(self, row)
+
+    def add(self, norm):
+        if self._row(norm.id) >= 0:
+            raise KeyError(f"Norm {norm.id} is already registered")
+        row = self._size
+        self._reserve(row + 1)
+        if norm.id >= len(self._row_of_id):
+            self._row_of_id = self._grown(self._row_of_id, max(norm.id + 1, 2 * len(self._row_of_id)), -1)
+        self.ids[row] = norm.id
+        self.kind_codes[row] = self._intern(getattr(norm, 'kind', type(norm)), self.kinds, self._kind_codes)
+        self.valid[row] = norm.valid
+        self.complexity[row] = norm.complexity
+        self.norm_type_codes[row] = self._intern(norm.norm_type, self.norm_types, self._norm_type_codes)
+        self.text_codes[row] = text_code = self._intern(norm.text, self.texts, self._text_codes)
+        self._link_text(row, text_code)
+        self.alive[row] = True
+        if norm.history:
+            self.histories[row] = list(norm.history)
+        extras = {name: value for name, value in getattr(norm, '__dict__', {}).items() if name not in _NORM_FIELDS}
+        if extras:
+            self.attributes[row] = extras
+        self._row_of_id[norm.id] = row
+        self._dense[self._count] = row
+        self._slot[row] = self._count
+        self._size += 1
+        self._count += 1
+        if self.listener is not None:
+            self.listener.norm_added(norm)
+
+    def extend(self, norms):
+        for norm in norms:
+            self.add(norm)
+
+    def remove(self, norm):
+        row = self._row(norm.id)
+        if row < 0:
+            raise KeyError(f"Norm {norm.id} is not registered")
+        self.alive[row] = False
+        self._row_of_id[norm.id] = -1
+        self._unlink_text(row, int(self.text_codes[row]))
+        self.histories.pop(row, None)
+        self.attributes.pop(row, None)
+        self._count -= 1
+        slot = self._slot[row]
+        last = self._dense[self._count]
+        self._dense[slot] = last
+        self._slot[last] = slot
+        if self.listener is not None:
+            self.listener.norm_removed(norm)
+
+    def get(self, norm_id, default=None):
+        row = self._row(norm_id)
+        return self._view(row) if row >= 0 else default
+
+    def rows(self):
+        """Row indices of the live norms, in insertion order."""
+        return np.flatnonzero(self.alive[:self._size])
+
+    def of_type(self, norm_type):
+        code = self._norm_type_codes.get(norm_type)
+        if code is None:
+            return []
+        rows = np.flatnonzero(self.alive[:self._size] & (self.norm_type_codes[:self._size] == code))
+        return [self._view(row) for row in rows]
+
+    def with_text(self, text):
+        code = self._text_codes.get(text)
+        if code is None:
+            return []
+        norms = []
+        row = int(self._text_first[code])
+        while row >= 0:
+            norms.append(self._view(row))
+            row = int(self._next_same_text[row])
+        return norms
+
+    def latest(self, count):
+        """Return the `count` most recently registered norms, oldest first."""
+        norms = []
+        row = self._size - 1
+        while row >= 0 and len(norms) < count:
+            if self.alive[row]:
+                norms.append(self._view(row))
+            row -= 1
+        norms.reverse()
+        return norms
+
+    def sample(self, rng=random):
+        """Draw one norm uniformly at random; raises IndexError when empty, like random.choice."""
+        if not self._count:
+            raise IndexError("Cannot choose from an empty sequence")
+        return self._view(int(self._dense[rng.randrange(self._count)]))
+
+    def at(self, slot):
+        """Norm at a dense sampling slot, 0 <= slot < len(self); slots move on removal."""
+        return self._view(int(self._dense[slot]))
+
+    def adjust_complexity(self, adjustment, rows=None, low=COMPLEXITY_MIN, high=COMPLEXITY_MAX):
+        """Vectorized Norm.update_complexity over `rows` (all live norms by default), clamped to [low, high].
+
+        `adjustment` is one value or one per row; the listener hears of every complexity that moved.
+        """
+        rows = self.rows() if rows is None else np.asarray(rows)
+        old = self.complexity[rows].astype(np.int64)
+        new = np.clip(old + adjustment, low, high)
+        self.complexity[rows] = new
+        if self.listener is not None:
+            changed = np.flatnonzero(new != old)
+            for row, value in zip(rows[changed].tolist(), new[changed].tolist()):
+                self.record_change(self._view(row), "complexity", value)
+
+    def record_change(self, norm, field, value):
+        if self.listener is not None:
+            self.listener.norm_changed(norm, field, value)
+
+    def clear(self):
+        if self.listener is not None:
+            for norm in self:
+                self.listener.norm_removed(norm)
+        self.alive[:self._size] = False
+        self._row_of_id.fill(-1)
+        self.texts.clear()
+        self._text_codes.clear()
+        self._text_first.fill(-1)
+        self._text_last.fill(-1)
+        self.histories.clear()
+        self.attributes.clear()
+        self._size = 0
+        self._count = 0
+
+    def compact(self, force=False):
+        """Reclaim the rows of removed norms once they outnumber the live ones (always with force).
+
+        Live rows keep their order and sampling slots, but move: NormViews taken before
+        no longer point at their norm, so only compact between simulated days.
+        """
+        garbage = self._size - self._count
+        if not garbage or (not force and garbage <= max(self._count, 1024)):
+            return
+        rows = self.rows()
+        count = len(rows)
+        for column in ('ids', 'kind_codes', 'valid', 'complexity', 'norm_type_codes'):
+            values = getattr(self, column)
+            values[:count] = values[rows]
+        live_codes, text_codes = np.unique(self.text_codes[rows], return_inverse=True)
+        self.texts = [self.texts[code] for code in live_codes.tolist()]
+        self._text_codes = {text: code for code, text in enumerate(self.texts)}
+        self.text_codes[:count] = text_codes
+        # Relink rows of the same text: sorted by (text, row), consecutive rows of a text are neighbours
+        order = np.argsort(text_codes, kind='stable')
+        same_text = text_codes[order[1:]] == text_codes[order[:-1]]
+        self._next_same_text[:count] = -1
+        self._previous_same_text[:count] = -1
+        self._next_same_text[order[:-1][same_text]] = order[1:][same_text]
+        self._previous_same_text[order[1:][same_text]] = order[:-1][same_text]
+        self._text_first.fill(-1)
+        self._text_last.fill(-1)
+        if count:
+            starts = np.flatnonzero(np.concatenate(([True], ~same_text)))
+            ends = np.concatenate((starts[1:] - 1, [count - 1]))
+            self._text_first[text_codes[order[starts]]] = order[starts]
+            self._text_last[text_codes[order[ends]]] = order[ends]
+        new_rows = np.full(self._size, -1, dtype=np.int64)
+        new_rows[rows] = np.arange(count)
+        self.histories = {int(new_rows[row]): history for row, history in self.histories.items()}
+        self.attributes = {int(new_rows[row]): extras for row, extras in self.attributes.items()}
+        self.alive[:count] = True
+        self.alive[count:self._size] = False
+        self._row_of_id[self.ids[:count]] = np.arange(count)
+        self._dense[:count] = new_rows[self._dense[:count]]
+        self._slot[self._dense[:count]] = np.arange(count)
+        self._size = count
+
+    def nbytes(self):
+        columns = (self.ids, self.kind_codes, self.valid, self.complexity, self.norm_type_codes,
+                   self.text_codes, self.alive, self._row_of_id, self._dense, self._slot,
+                   self._text_first, self._text_last, self._next_same_text, self._previous_same_text)
+        return sum(column.nbytes for column in columns)
+
+    def __contains__(self, norm_id):
+        return self._row(norm_id) >= 0
+
+    def __iter__(self):
+        return (self._view(row) for row in self.rows())
+
+    def __len__(self):
+        return self._count
+
+class NormSampler:
+    """Draw norms across several pools as if they were one, without concatenating them.
+
+    Uniform draws pick a dense slot in the union; complexity-weighted draws use
+    rejection against max_weight, which costs at most max_weight / COMPLEXITY_MIN
+    tries per norm and allocates nothing. Should rejection keep failing (complexities
+    at or below 0), the draw falls back to one exact pass over every norm.
+    """
+    rejection_tries = 64  # Per unit of max_weight; with every weight >= 1 the fallback has odds of about e**-64
+
+    def __init__(self, pools, max_weight=COMPLEXITY_MAX):
+        self.pools = pools
+        self.max_weight = max_weight
+
+    def _at(self, slot):
+        for pool in self.pools:
+            if slot < len(pool):
+                return pool.at(slot)
+            slot -= len(pool)
+        raise IndexError(slot)
+
+    def sample(self, rng=random, weighted=False):
+        """Draw one norm; raises IndexError when every pool is empty, like random.choice."""
+        total = len(self)
+        if not total:
+            raise IndexError("Cannot choose from an empty sequence")
+        if not weighted:
+            return self._at(rng.randrange(total))
+        for _ in range(self.rejection_tries * max(self.max_weight, 1)):
+            norm = self._at(rng.randrange(total))
+            if rng.random() * self.max_weight < norm.complexity:
+                return norm
+        return self._scan(rng, total)
+
+    def _scan(self, rng, total):
+        """Exact complexity-weighted draw over every norm, uniform when no weight is positive."""
+        norms = [self._at(slot) for slot in range(total)]
+        weights = [max(norm.complexity, 0) for norm in norms]
+        if not any(weights):
+            return rng.choice(norms)
+        return rng.choices(norms, weights)[0]
+
+    def sample_many(self, count, rng=random, weighted=False):
+        return [self.sample(rng, weighted) for _ in range(count)]
+
+    def __len__(self):
+        return sum(len(pool) for pool in self.pools)
+
+class Case:
+    def __init__(self, case_id, text, norm_id, constitutional, complexity, norm_kind=0, norm_type=None):
+        self.id = case_id
+        self.text = text
+        self.norm_id = norm_id
+        self.norm_kind = norm_kind  # _norm_kind_code of the referenced norm, and its type, for the PrecedentStore
+        self.norm_type = norm_type
+        self.constitutional = constitutional
+        self.filed_constitutional = constitutional  # Verdict at filing; apply_precedent overwrites constitutional
+        self.complexity = complexity
+        self.history = []
+        self.cassation_count = 0
+        self.status = {
+            "first_instance": False,
+            "appeal": False,
+            "cassation": 0  # Track the number of cassations
+        }
+        self.final_outcome = None
+        self.contested = False  # Rejected at first instance, so appeal or cassation has the last word
+        self.settled_by_precedent = False
+        self.filed_at = None  # Simulated times (in days) kept by the CourtScheduler for the court metrics
+        self.stage_arrived_at = None
+        judicial_logger.info("Case %s: A new case is brought to the Courts", self.id)
+
+    def apply_precedent(self, precedent):
+        self.constitutional = precedent
+        judicial_logger.info("Case %s: Applied precedent, reaffirmed validity status of norm: %s", self.id, self.constitutional)
+        self.history.append(('constitutional', self.constitutional, time.time()))
+
+    def update_complexity(self, adjustment):
+        old_complexity = self.complexity
+        self.complexity = max(COMPLEXITY_MIN, min(COMPLEXITY_MAX, self.complexity + adjustment))
+        judicial_logger.info("Case %s: Updated complexity from %s to %s", self.id, old_complexity, self.complexity)
+        self.history.append(('complexity', self.complexity, time.time()))
+
+    def process_in_first_instance(self):
+        if not self.status["first_instance"]:
+            self.status["first_instance"] = True
+            judicial_logger.info("Case %s: Processing in First Instance Court", self.id)
+            self.final_outcome = self.simulate_hearing()
+            return self.final_outcome
+        return None
+
+    def process_in_appeal(self):
+        if not self.status["appeal"]:
+            self.status["appeal"] = True
+            judicial_logger.info("Case %s: Processing in Appeal Court", self.id)
+            self.final_outcome = self.simulate_hearing()
+            return self.final_outcome
+        return None
+
+    def process_in_cassation(self):
+        if self.status["cassation"] < MAX_CASSATIONS:
+            self.status["cassation"] += 1
+            judicial_logger.info("Case %s: Processing in Court of Cassation, cassation count: %s", self.id, self.status['cassation'])
+            cassation_outcome = self.simulate_hearing()
+            if cassation_outcome == "accepted":
+                self.final_outcome = "accepted"
+                return "accepted"
+            elif cassation_outcome == "rejected":
+                self.status["appeal"] = False  # Reset appeal status
+                return "rejected"
+        return None
+
+    def simulate_hearing(self):
+        return random.choice(["accepted", "rejected"])
+
+    def get_history(self):
+        judicial_logger.info("Case %s: Getting history", self.id)
+        return self.history
+
+    def __str__(self):
+        return f"Case(id={self.id}, text={self.text}, norm_id={self.norm_id}, constitutional={self.constitutional}, complexity={self.complexity})"
+
+class Court:
+    def __init__(self, court_name, streams=None, capacity=1, mean_service_days=1.0):
+        self.court_name = court_name
+        self.rng, self.np_rng = _stream_pair(streams)
+        self.event_log = None
+        self.capacity = capacity  # Cases heard at the same time, used by the CourtScheduler
+        self.mean_service_days = mean_service_days
+        judicial_logger.info("%s Court: Initialized", self.court_name)
+
+    def service_time(self):
+        """Days one hearing takes; exponential by default, override for another distribution."""
+        return self.rng.expovariate(1.0 / self.mean_service_days)
+
+    def file_case(self, case):
+        judicial_logger.info("%s Court: Case %s filed", self.court_name, case.id)
+        judicial_logger.info("Case %s: Filed in %s court", case.id, self.court_name)
+
+    def conduct_hearing(self, case):
+        judicial_logger.info("%s Court: Conducted hearing for case %s", self.court_name, case.id)
+        judicial_logger.info("Case %s: Hearing conducted in %s court", case.id, self.court_name)
+
+    def render_judgment(self, case):
+        judgment = self.rng.choice(["accepted", "rejected"])
+        judicial_logger.info("%s Court: Rendered judgment for case %s: %s", self.court_name, case.id, judgment)
+        judicial_logger.info("Case %s: Judgment rendered in %s court: %s", case.id, self.court_name, judgment)
+        if self.event_log is not None:
+            self.event_log.record("JUDGMENT", self.court_name, subject=case.id, related=case.norm_id,
+                                  value=judgment == "accepted", detail=case.cassation_count)
+        return judgment
+
+    def render_judgments(self, count):
+        """Vectorized render_judgment for `count` cases: True where the judgment is 'accepted'."""
+        return self.np_rng.random(count) < 0.5
+
+class PoliticalSystem:
+    def __init__(self, pool_class=NormRegistry, streams=None, config=None):
+        self.rng, self.np_rng = _stream_pair(streams)
+        self.config = config if config is not None else SimulationConfig()
+        self.norm_pool = pool_class()
+        self.norm_counter = 0
+        self.archive = Archive(NORM_ARCHIVE_DTYPE)  # Norms that left the pools
+        self.regulation_pool = pool_class()
+        self.regulation_counter = 0
+        self.action = "decision"
+        self.judicial_system = None
+        self.event_log = None
+
+    def record_norm_created(self, norm):
+        if self.event_log is not None:
+            self.event_log.record("NORM_CREATED", self.get_body_name(), norm, value=norm.valid, detail=norm.complexity)
+
+    def generate_norms(self):
+        new_norm = self.create_norm()
+        if new_norm and new_norm.id not in self.norm_pool:
+            self.norm_pool.add(new_norm)
+            self.norm_counter += 1
+            political_logger.info("%s: Generated new %s", self.get_body_name(), self.get_norm_type())
+            self.record_norm_created(new_norm)
+            if isinstance(new_norm, Law):
+                self.judicial_system.control_norm_constitutionality(new_norm, "CONTRÔLE OBLIGATOIRE A PRIORI")
+
+    def create_norm(self):
+        raise NotImplementedError("Must be implemented by subclasses")
+
+    def retire_norm(self, norm, reason="abrogated"):
+        """Move a norm from the pool to the archive."""
+        self.norm_pool.remove(norm)
+        self.archive.append(_norm_kind_code(norm), norm.id, norm.complexity, norm.valid, _ARCHIVE_REASON_CODES[reason])
+
+    def retire_all(self, pool, reason):
+        """Archive and clear a whole pool; verdicts on its norms are dropped, as their ids start over."""
+        for norm in pool:
+            self.archive.append(_norm_kind_code(norm), norm.id, norm.complexity, norm.valid, _ARCHIVE_REASON_CODES[reason])
+            if self.judicial_system is not None:
+                self.judicial_system.norms_constitutionality.forget(norm)
+                self.judicial_system.precedents.pop(norm.id, None)
+        pool.clear()
+
+    def produce_norms_decision(self):
+        if self.has_decision():
+            new_norms = []
+            for _ in range(2):
+                new_norm = self.create_norm()
+                if new_norm and new_norm.id not in self.norm_pool:
+                    self.norm_pool.add(new_norm)
+                    self.norm_counter += 1
+                    self.record_norm_created(new_norm)
+                    if isinstance(new_norm, Law):
+                        self.judicial_system.control_norm_constitutionality(new_norm, "CONTRÔLE DE CONSTITUTIONNALITÉ OBLIGATOIRE A PRIORI")
+                    new_norms.append(new_norm)
+                    political_logger.info("%s: Created new %s by political decision", self.get_body_name(), self.get_norm_type())
+            return new_norms
+        return []
+
+    def has_decision(self):
+        return self.action == "decision"
+
+    def send_expectations(self, citizen_pressure):
+        expectations = [norm.text for norm in self.norm_pool.latest(3)]
+        if citizen_pressure > 3:
+            expectations.append("Prioritize Norm Enforcement")
+        political_logger.info("%s: Expectations sent based on citizen pressure: %s", self.get_body_name(), citizen_pressure)
+        return expectations
+
+    def receive_stabilization(self, stabilized_norms):
+        for norm in stabilized_norms:
+            political_logger.info("%s: Norm %s stabilized", self.get_body_name(), norm.id)
+        political_logger.info("%s: The norms are being applied: stabilization", self.get_body_name())
+
+    def make_regulations(self, citizen_pressure):
+        raise NotImplementedError("Must be implemented by subclasses")
+
+    def perform_actions(self):
+        actions = [norm.text for norm in self.norm_pool.latest(3)]
+        political_logger.info("%s: Performed actions: %s", self.get_body_name(), actions)
+        return actions
+
+    def random_event(self):
+        event = self.rng.choice(SCENARIO_EVENTS)
+        political_logger.info("%s: Random event occurred: %s", self.get_body_name(), event)
+        return event
+
+    def reform_norm(self, norm_id):
+        norm = self.norm_pool.get(norm_id)
+        if norm is not None:
+            new_complexity = self.rng.randint(self.config.complexity_min, self.config.complexity_max)
+            norm.complexity = new_complexity
+            norm.valid = self.rng.choice([True, False])
+            self.norm_pool.record_change(norm, "complexity", norm.complexity)
+            self.norm_pool.record_change(norm, "valid", norm.valid)
+            self.judicial_system.norms_constitutionality.invalidate(norm)
+            political_logger.info("%s: Norm %s reformed with new complexity %s and validity %s", self.get_body_name(), norm.id, new_complexity, norm.valid)
+            self.judicial_system.control_norm_constitutionality(norm)
+
+    def get_body_name(self):
+        raise NotImplementedError("Must be implemented by subclasses")
+
+    def get_norm_type(self):
+        raise NotImplementedError("Must be implemented by subclasses")
+
+class Parliament(PoliticalSystem):
+    def create_norm(self):
+        return Law(
+            norm_id=self.norm_counter,
+            text=f'Law {self.norm_counter}',
+            valid=self.rng.choice([True, False]),
+            complexity=self.rng.randint(self.config.complexity_min, self.config.complexity_max)
+        )
+
+    def make_regulations(self, citizen_pressure):
+        return []  # Parliament doesn't make regulations
+
+    def get_dissolved(self):
+        """Dissolve the parliament and prepare for new elections."""
+        self.retire_all(self.norm_pool, "dissolved")
+        self.norm_counter = 0
+        political_logger.info("PARLIAMENT: The National Assembly has been dissolved. All laws are reset.")
+
+    def get_body_name(self):
+        return "PARLIAMENT"
+
+    def get_norm_type(self):
+        return "LAW"
+
+class Government(PoliticalSystem):
+    def __init__(self, prime_minister="", pool_class=NormRegistry, streams=None, config=None):
+        super().__init__(pool_class, streams, config)
+        self.prime_minister = prime_minister
+        self.in_emergency_state = False  # State to track emergency status
+        self.article_49_3_count = 0  # Track the usage of Article 49.3
+        political_logger.info("GOVERNMENT: Initialized under Prime Minister %s", self.prime_minister)
+
+    def get_body_name(self):
+        return "GOVERNMENT"
+
+    def create_norm(self):
+        regulation = Regulation(
+            norm_id=self.regulation_counter,
+            text=f'Regulation {self.regulation_counter}',
+            valid=True,  # Regulations are assumed valid initially
+            complexity=self.rng.randint(self.config.complexity_min, self.config.complexity_max)
+        )
+        self.regulation_counter += 1
+        return regulation
+
+    def make_regulations(self, citizen_pressure):
+        regulations = []
+        if citizen_pressure > 3 and self.norm_pool:
+            norm = self.norm_pool.sample(self.rng)
+            regulation_a = Regulation(
+                norm_id=self.regulation_counter,
+                text=f"Regulation {self.regulation_counter} based on Law {norm.id}",
+                valid=True,
+                complexity=self.rng.randint(self.config.complexity_min, self.config.complexity_max)
+            )
+            regulation_b = Regulation(
+                norm_id=self.regulation_counter + 1,
+                text=f"Regulation {self.regulation_counter + 1} based on Law {norm.id}",
+                valid=True,
+                complexity=self.rng.randint(self.config.complexity_min, self.config.complexity_max)
+            )
+            regulations.extend([regulation_a, regulation_b])
+            self.regulation_counter += 2
+            self.regulation_pool.extend([regulation_a, regulation_b])
+            self.record_norm_created(regulation_a)
+            self.record_norm_created(regulation_b)
+            political_logger.info("GOVERNMENT: Made regulations based on citizen pressure: %s", [regulation_a.text, regulation_b.text])
+        return regulations
+
+    def handle_emergency_state(self):
+        """Manage actions during emergency state."""
+        self.in_emergency_state = True
+        political_logger.info("GOVERNMENT: State of emergency declared. Special measures in effect.")
+
+    def lift_emergency_state(self):
+        """Lift the emergency state and return to normal operation."""
+        self.in_emergency_state = False
+        political_logger.info("GOVERNMENT: State of emergency lifted. Returning to normal operations.")
+
+    def use_49_3(self, law):
+        """Simulate the use of Article 49.3 to pass a law without a vote."""
+        self.article_49_3_count += 1
+        law.adopted_without_vote = True
+        political_logger.info("GOVERNMENT: Used 49.3 to adopt Law %s without vote.", law.id)
+        if self.event_log is not None:
+            self.event_log.record("ARTICLE_49_3", self.get_body_name(), law, detail=self.article_49_3_count)
+        self.judicial_system.control_norm_constitutionality(law)
+        
+        # Check if engagement of responsibility and censure should be activated
+        if self.article_49_3_count % 5 == 0:
+            self.engagement_of_responsibility()
+
+    def engagement_of_responsibility(self):
+        """Simulate engagement of government's responsibility and potential censure."""
+        if self.rng.random() < 0.2:  # 20% chance of censure
+            political_logger.info("GOVERNMENT: Engagement of responsibility failed. Government censured.")
+            censured = True
+            self.judicial_system.censure_government()
+        else:
+            political_logger.info("GOVERNMENT: Engagement of responsibility succeeded. Government not censured.")
+            censured = False
+        if self.event_log is not None:
+            self.event_log.record("CENSURE", self.get_body_name(), value=censured)
+
+    def get_norm_type(self):
+        return "REGULATION"
+
+class President(PoliticalSystem):
+    def __init__(self, name, pool_class=NormRegistry, streams=None, config=None):
+        super().__init__(pool_class, streams, config)
+        self.name = name
+        self.iteration_count = 0
+        self.dissolution_count = 0
+        political_logger.info("PRESIDENT: President %s inaugurated", self.name)
+
+    def create_regulation_to_veto_law(self, law):
+        """Create a regulation to veto a specific law."""
+        regulation = Regulation(
+            norm_id=self.regulation_counter,
+            text=f"Regulation {self.regulation_counter} to veto Law {law.id}",
+            valid=True,
+            complexity=self.rng.randint(self.config.complexity_min, self.config.complexity_max)
+        )
+        self.regulation_counter += 1
+        political_logger.info("PRESIDENT: Created regulation %s to veto Law %s", regulation.text, law.id)
+        return regulation
+
+    def attempt_veto(self, laws):
+        """Attempt to veto a law every `veto_period` iterations (15 by default)."""
+        self.iteration_count += 1
+        if self.iteration_count % self.config.veto_period == 0 and laws:
+            law_to_veto = laws.sample(self.rng)
+            veto_regulation = self.create_regulation_to_veto_law(law_to_veto)
+            political_logger.info("PRESIDENT: Vetoed law %s with regulation %s", law_to_veto.id, veto_regulation.text)
+            if self.event_log is not None:
+                self.event_log.record("VETO", self.get_body_name(), law_to_veto, related=veto_regulation.id)
+            return veto_regulation, law_to_veto
+        return None, None
+    
+    def dissolve_assembly(self, parliament):
+        """Dissolve the National Assembly and reconstitute without elections, limited to once."""
+        if self.dissolution_count < 1:
+            parliament.get_dissolved()
+            parliament.reconstitute()
+            self.dissolution_count += 1
+            political_logger.info("PRESIDENT: Dissolved the National Assembly and reconstituted it without elections.")
+        else:
+            political_logger.info("PRESIDENT: Dissolution limit reached, cannot dissolve again.")
+
+    def request_referendum(self, law):
+        """Request a referendum on a specific law."""
+        outcome = self.rng.choice(["approved", "rejected"])
+        political_logger.info("PRESIDENT: Requested a referendum on %s. Outcome: %s", law.text, outcome)
+        return outcome
+
+    def appoint_prime_minister(self, government, new_pm_name):
+        """Appoint a new Prime Minister."""
+        government.prime_minister = new_pm_name
+        political_logger.info("PRESIDENT: Appointed %s as Prime Minister", new_pm_name)
+
+    def initiate_emergency_state(self, government):
+        """Initiate an emergency state for handling crises."""
+        government.handle_emergency_state()
+        political_logger.info("PRESIDENT: Declared a state of emergency due to a national crisis.")
+
+    def lift_emergency_state(self, government):
+        """Lift the emergency state and return to normal operations."""
+        government.lift_emergency_state()
+        political_logger.info("PRESIDENT: State of emergency lifted, returning to normal operations.")
+
+    def propose_amendment(self, law_text):
+        """Propose an amendment to the constitution or law."""
+        amendment = f"Amendment: {law_text}"
+        political_logger.info("PRESIDENT: Proposed amendment: %s", amendment)
+        return amendment
+
+    def coordinate_with_prime_minister(self, government):
+        """Coordinate with the Prime Minister on policies."""
+        political_logger.info("PRESIDENT: Coordinated with Prime Minister %s on national policies.", government.prime_minister)
+
+    def get_body_name(self):
+        """Return the name of the body, i.e., PRESIDENT."""
+        return "PRESIDENT"
+
+    def get_norm_type(self):
+        """Return the type of norms the President creates, which are EXECUTIVE ORDERS."""
+        return "EXECUTIVE ORDER"
+
+class PrimeMinister(Government):
+    def __init__(self, name, pool_class=NormRegistry, streams=None, config=None):
+        super().__init__(prime_minister=name, pool_class=pool_class, streams=streams, config=config)
+        self.name = name
+        political_logger.info("PRIME MINISTER: Prime Minister %s appointed", self.name)
+
+    def get_body_name(self):
+        return "PRIME MINISTER"
+
+    def create_norm(self):
+        return None  # The Prime Minister oversees the Government but does not directly create norms
+
+    def get_norm_type(self):
+        return "POLICY DECISION"
+
+    def form_new_government(self):
+        """Form a new government by appointing new ministers."""
+        self.retire_all(self.norm_pool, "new government")  # Clear all existing regulations
+        self.retire_all(self.regulation_pool, "new government")
+        political_logger.info("PRIME MINISTER %s: Formed a new government with new policies and regulations.", self.name)
+
+    def resign(self):
+        """Handle resignation of the Prime Minister."""
+        political_logger.info("PRIME MINISTER %s: Resigned from office.", self.name)
+
+    def appoint_ministers(self):
+        """Appoint new ministers to the government."""
+        ministers = ["Minister of Finance", "Minister of Education", "Minister of Health"]
+        for minister in ministers:
+            political_logger.info("PRIME MINISTER %s: Appointed %s.", self.name, minister)
+
+    def activate_49_3(self, law):
+        """Prime Minister activates Article 49.3 for a law."""
+        political_logger.info("PRIME MINISTER %s: Activated 49.3 for Law %s.", self.name, law.id)
+        self.use_49_3(law)
+
+    def handle_censure(self):
+        """Handle the scenario when the government is censured."""
+        political_logger.info("PRIME MINISTER %s: Government censured. Preparing resignation and new government formation.", self.name)
+        self.resign()
+        self.form_new_government()
+
+class VerdictCache:
+    """Constitutionality verdicts keyed by (norm kind, id, revision).
+
+    Laws and regulations number their ids independently, hence the kind in the key;
+    the revision is bumped by invalidate() whenever a norm is reformed or removed, so
+    a stale verdict is never returned. maxsize bounds the cache with LRU eviction.
+    """
+
+    def __init__(self, maxsize=None):
+        self.maxsize = maxsize
+        self._verdicts = OrderedDict()
+        self._revisions = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def key(self, norm):
+        norm_key = (_norm_kind_code(norm), norm.id)
+        return norm_key + (self._revisions.get(norm_key, 0),)
+
+    def get(self, norm):
+        key = self.key(norm)
+        verdict = self._verdicts.get(key)
+        if verdict is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._verdicts.move_to_end(key)
+        return verdict
+
+    def put(self, norm, verdict):
+        key = self.key(norm)
+        self._verdicts[key] = verdict
+        self._verdicts.move_to_end(key)
+        if self.maxsize is not None and len(self._verdicts) > self.maxsize:
+            self._verdicts.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, norm):
+        """Bump the norm's revision and drop its current verdict."""
+        key = self.key(norm)
+        self._verdicts.pop(key, None)
+        self._revisions[key[:2]] = key[2] + 1
+
+    def forget(self, norm):
+        """Drop the verdict and revision of a norm leaving the pools; its id may be handed out again."""
+        key = self.key(norm)
+        self._verdicts.pop(key, None)
+        self._revisions.pop(key[:2], None)
+
+    def clear(self):
+        self._verdicts.clear()
+        self._revisions.clear()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions, 'size': len(self._verdicts),
+                'hit_rate': self.hits / lookups if lookups else 0.0}
+
+    def __contains__(self, norm):
+        return self.key(norm) in self._verdicts
+
+    def __len__(self):
+        return len(self._verdicts)
+
+class CheckMemo:
+    """Per-day memo of check results, keyed by (norm kind, id).
+
+    Entries are stamped with the generation (simulated day) they were stored in and
+    only count for that generation, so advance() resets the memo in O(1). Stale entries
+    are overwritten in place; the table is emptied when they outnumber the entries of
+    the day just ended, which keeps it proportional to the norms checked per day.
+    """
+
+    def __init__(self):
+        self.generation = 0
+        self._entries = {}  # (kind, id) -> (generation, result)
+        self._current = 0  # Entries stamped with the current generation
+
+    def advance(self, generation=None):
+        """Start a new generation (the next one by default); results stored so far expire."""
+        generation = self.generation + 1 if generation is None else generation
+        if generation == self.generation:
+            return
+        if len(self._entries) > 2 * max(self._current, 256):
+            self._entries.clear()
+        self.generation = generation
+        self._current = 0
+
+    def get(self, norm, default=None):
+        entry = self._entries.get((_norm_kind_code(norm), norm.id))
+        return entry[1] if entry is not None and entry[0] == self.generation else default
+
+    def put(self, norm, result):
+        key = (_norm_kind_code(norm), norm.id)
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != self.generation:
+            self._current += 1
+        self._entries[key] = (self.generation, result)
+
+    def __contains__(self, norm):
+        entry = self._entries.get((_norm_kind_code(norm), norm.id))
+        return entry is not None and entry[0] == self.generation
+
+    def __len__(self):
+        return self._current
+
+class PrecedentStore:
+    """Recent decisions of the courts, indexed for nearest-precedent lookups.
+
+    Decisions are bucketed by (norm kind, norm type, constitutional status at filing,
+    contested, complexity bucket): a case rejected at first instance is only compared
+    with other contested cases, not with those the first instance accepted. Cases
+    settled by precedent are not added, so they never vote for their own precedents.
+    similar() walks the buckets of the same attributes outwards from the case's
+    complexity and takes the most recent decisions of each, so a lookup costs a few
+    dict accesses. Each bucket keeps its `depth` most recent decisions only; the full
+    record of closed cases is the JudicialSystem's case archive.
+    """
+
+    def __init__(self, complexity_bucket=1, depth=256):
+        self.complexity_bucket = complexity_bucket
+        self.depth = depth
+        self._buckets = {}  # (kind, type, constitutional, contested, complexity bucket) -> recent decisions
+        self._bucket_range = None
+        self.decisions = 0  # Decisions ever added, including those dropped from their bucket since
+        self.lookups = 0
+        self.reused = 0
+
+    def key(self, case):
+        return (case.norm_kind, case.norm_type, bool(case.filed_constitutional), case.contested,
+                case.complexity // self.complexity_bucket)
+
+    def add(self, case):
+        if case.settled_by_precedent:
+            return
+        key = self.key(case)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = deque(maxlen=self.depth)
+        # (sequence, case id, norm id, complexity, accepted); the sequence orders decisions across buckets
+        bucket.append((self.decisions, case.id, case.norm_id, case.complexity, case.final_outcome == "accepted"))
+        self.decisions += 1
+        low, high = self._bucket_range or (key[-1], key[-1])
+        self._bucket_range = (min(low, key[-1]), max(high, key[-1]))
+
+    def _nearest(self, case, k):
+        """The k decisions most similar to `case`: closest complexity bucket first, then most recent."""
+        self.lookups += 1
+        k = min(k, self.depth)
+        if k < 1 or self._bucket_range is None:
+            return []
+        *attributes, bucket = self.key(case)
+        low, high = self._bucket_range
+        nearest = []
+        distance = 0
+        while len(nearest) < k and (bucket - distance >= low or bucket + distance <= high):
+            found = []
+            for other in {bucket - distance, bucket + distance}:
+                decisions = self._buckets.get((*attributes, other), ())
+                found.extend(itertools.islice(reversed(decisions), k))
+            found.sort(reverse=True)
+            nearest.extend(found[:k - len(nearest)])
+            distance += 1
+        return nearest
+
+    def similar(self, case, k=5):
+        """The k earlier decisions closest to `case`, as (case id, norm id, complexity, outcome) tuples."""
+        outcomes = ("rejected", "accepted")
+        return [(case_id, norm_id, complexity, outcomes[accepted])
+                for _, case_id, norm_id, complexity, accepted in self._nearest(case, k)]
+
+    def verdict(self, case, k=5, agreement=0.8):
+        """Outcome shared by at least `agreement` of the k nearest decisions, or None if there is no such consensus."""
+        nearest = self._nearest(case, k)
+        if len(nearest) < k:
+            return None
+        accepted = sum(decision[4] for decision in nearest) / k
+        if accepted >= agreement:
+            outcome = "accepted"
+        elif 1.0 - accepted >= agreement:
+            outcome = "rejected"
+        else:
+            return None
+        self.reused += 1
+        return outcome
+
+    def stats(self):
+        return {'decisions': self.decisions, 'retained': len(self), 'buckets': len(self._buckets),
+                'lookups': self.lookups, 'reused': self.reused,
+                'reuse_rate': self.reused / self.lookups if self.lookups else 0.0}
+
+    def __len__(self):
+        return sum(len(bucket) for bucket in self._buckets.values())
+
+COURT_STAGES = ["First Instance", "Appeal", "Court of Cassation"]
+
+class CourtMetrics:
+    """Backlog and latency of the court stages.
+
+    Per day: cases queued and cases being heard at each stage, in NumPy arrays. Per
+    closed case, read from the case archive: sojourn time from filing to final judgment
+    (in days), cassation rounds and outcome. Per court visit, kept in an archive of its
+    own: stage and time spent there, queueing included. Sojourn and visit times are
+    only non-zero with the CourtScheduler, the other modes resolve cases the day they
+    are filed.
+    """
+
+    def __init__(self, days, cases):
+        self.days = 0
+        self._queued = np.zeros((max(days, 1), len(COURT_STAGES)), dtype=np.int64)
+        self._in_service = np.zeros_like(self._queued)
+        self.cases = cases
+        self.visits = Archive(VISIT_ARCHIVE_DTYPE)
+
+    def record_day(self, queued, in_service):
+        if self.days == len(self._queued):
+            self._queued = np.concatenate([self._queued, np.zeros_like(self._queued)])
+            self._in_service = np.concatenate([self._in_service, np.zeros_like(self._in_service)])
+        self._queued[self.days] = queued
+        self._in_service[self.days] = in_service
+        self.days += 1
+
+    def record_visit(self, stage, duration):
+        self.visits.append(stage, duration)
+
+    @property
+    def queued(self):
+        """(day x stage) cases waiting for a hearing at the end of each day; stages are COURT_STAGES."""
+        return self._queued[:self.days]
+
+    @property
+    def in_service(self):
+        return self._in_service[:self.days]
+
+    @property
+    def sojourn(self):
+        return self.cases.column('sojourn')
+
+    @property
+    def cassations(self):
+        return self.cases.column('cassations')
+
+    @property
+    def accepted(self):
+        return self.cases.column('accepted')
+
+    def visit_times(self, stage):
+        return self.visits.find(stage=COURT_STAGES.index(stage))['time']
+
+    def cassation_loops(self):
+        """Number of closed cases per count of cassation rounds (index = rounds)."""
+        return np.bincount(self.cassations, minlength=1)
+
+    def percentiles(self, q=(50, 95, 99)):
+        """Sojourn and per-stage visit time percentiles, in days; NaN while nothing was recorded."""
+        def percentile(values):
+            return np.percentile(values, q) if len(values) else np.full(len(q), np.nan)
+        result = {'sojourn': percentile(self.sojourn)}
+        for stage in COURT_STAGES:
+            result[stage] = percentile(self.visit_times(stage))
+        return result
+
+class CourtScheduler:
+    """Discrete-event routing of cases through First Instance, Appeal and Cassation.
+
+    Each court hears at most `capacity` cases at once, each for court.service_time()
+    days; the other cases wait in its FIFO queue. Only hearings in progress sit on the
+    event heap, so queued cases and idle days cost nothing. Routing follows
+    process_cases: a rejected first-instance case goes to appeal, a rejected appeal to
+    cassation, a cassation rejection back to appeal, until a court accepts or the
+    cassation rounds run out.
+    """
+
+    def __init__(self, judicial_system):
+        self.judicial_system = judicial_system
+        self.courts = (judicial_system.first_instance, judicial_system.appeal_court, judicial_system.cassation_court)
+        self.now = 0.0
+        self._hearings = []  # Heap of (end time, sequence, court, case)
+        self._sequence = itertools.count()
+        self.queues = {court: deque() for court in self.courts}
+        self.busy = {court: 0 for court in self.courts}
+        self.closed = 0
+
+    def submit(self, case, court=None):
+        """File a new case at `court` (First Instance by default) at the current time."""
+        case.filed_at = self.now
+        self._arrive(court if court is not None else self.judicial_system.first_instance, case, self.now)
+
+    def submit_many(self, cases):
+        for case in cases:
+            self.submit(case)
+
+    def _arrive(self, court, case, time):
+        court.file_case(case)
+        case.stage_arrived_at = time
+        if self.busy[court] < court.capacity:
+            self._start(court, case, time)
+        else:
+            self.queues[court].append(case)
+
+    def _start(self, court, case, time):
+        self.busy[court] += 1
+        court.conduct_hearing(case)
+        heapq.heappush(self._hearings, (time + court.service_time(), next(self._sequence), court, case))
+
+    def _route(self, court, case):
+        """Next court for a judged case, or None when its chain ends."""
+        judicial_system = self.judicial_system
+        accepted = case.final_outcome == "accepted"
+        if court is judicial_system.first_instance:
+            return None if accepted or judicial_system.settle_by_precedent(case) else judicial_system.appeal_court
+        if case.cassation_count >= judicial_system.config.max_cassations:
+            return None
+        if court is judicial_system.appeal_court:
+            if accepted:
+                return None
+        elif not accepted:
+            return judicial_system.appeal_court
+        case.cassation_count += 1
+        return judicial_system.cassation_court
+
+    def advance(self, days):
+        """Run every hearing that ends within the next `days` and return the cases closed."""
+        until = self.now + days
+        closed = []
+        while self._hearings and self._hearings[0][0] <= until:
+            time, _, court, case = heapq.heappop(self._hearings)
+            self.busy[court] -= 1
+            case.final_outcome = court.render_judgment(case)
+            self.judicial_system.metrics.record_visit(self.courts.index(court), time - case.stage_arrived_at)
+            if self.queues[court]:
+                self._start(court, self.queues[court].popleft(), time)
+            next_court = self._route(court, case)
+            if next_court is None:
+                self.judicial_system.close_case(case, time)
+                closed.append(case)
+            else:
+                self._arrive(next_court, case, time)
+        self.now = until
+        self.closed += len(closed)
+        return closed
+
+    def backlog(self):
+        """Cases waiting in a queue or being heard, per court name."""
+        return {court.court_name: len(self.queues[court]) + self.busy[court] for court in self.courts}
+
+    def queue_lengths(self):
+        return [len(self.queues[court]) for court in self.courts]
+
+    def in_service(self):
+        return [self.busy[court] for court in self.courts]
+
+    def __len__(self):
+        return sum(len(queue) for queue in self.queues.values()) + len(self._hearings)
+
+class JudicialSystem:
+    def __init__(self, parliament, government, president, batch_mode=False, clock=None, streams=None, config=None,
+                 verdict_cache_size=None, scheduled=False):
+        self.case_pool = []
+        self.case_counter = 0
+        self.case_ids = set()  # Open cases only; closed ones move to case_archive
+        self.case_archive = Archive(CASE_ARCHIVE_DTYPE)
+        self.parliament = parliament
+        self.government = government
+        self.president = president
+        self.precedents = {}
+        self.precedent_store = PrecedentStore()
+        self.valid_rules = []
+        self.caseload = 0
+        self.judicial_decisions = 0
+        self.norms_constitutionality = VerdictCache(verdict_cache_size)
+        self.batch_mode = batch_mode
+        self.config = config if config is not None else SimulationConfig()
+        self.norm_sampler = NormSampler((parliament.norm_pool, government.norm_pool),
+                                        max_weight=max(self.config.complexity_max, COMPLEXITY_MAX))
+        self.clock = clock if clock is not None else RealTimeClock()
+        self.rng, self.np_rng = _stream_pair(streams)
+        self.event_log = None
+
+        # Initialize subsystems here, each court with its own child stream
+        court_streams = streams.spawn(4) if streams is not None else [None] * 4
+        self.first_instance = FirstInstance("First Instance", court_streams[0], self.config.first_instance_capacity,
+                                            self.config.first_instance_service_days)
+        self.appeal_court = Appeal("Appeal", court_streams[1], self.config.appeal_capacity, self.config.appeal_service_days)
+        self.cassation_court = Cassation("Court of Cassation", court_streams[2], self.config.cassation_capacity,
+                                         self.config.cassation_service_days)
+        self.constitutional_council = Court("Constitutional Council", court_streams[3])
+        # Scheduled mode: cases queue at courts of finite capacity instead of being resolved the day they are filed
+        self.scheduler = CourtScheduler(self) if scheduled else None
+        self.metrics = CourtMetrics(self.config.simulation_days, self.case_archive)
+
+    def control_norm_constitutionality(self, norm, check_type="CONTRÔLE DE CONSTITUTIONNALITÉ"):
+        is_constitutional = self.norms_constitutionality.get(norm)
+        if is_constitutional is None:
+            if check_type == "CONTRÔLE OBLIGATOIRE A PRIORI" and norm.norm_type == "ordinaire":
+                # Simulate constitutionality check for ordinary laws
+                is_constitutional = self.rng.choice([True, False])
+            else:
+                is_constitutional = norm.valid
+            self.norms_constitutionality.put(norm, is_constitutional)
+
+        judicial_logger.info("JudicialSystem: %s for norm %s: %s", check_type, norm.id, 'constitutional' if is_constitutional else 'unconstitutional')
+        if self.event_log is not None:
+            self.event_log.record("CONSTITUTIONALITY_CHECK", "JudicialSystem", norm, value=is_constitutional,
+                                  detail=_CHECK_TYPE_CODES.get(check_type, 0))
+        if not is_constitutional:
+            self.remove_norm(norm)
+            judicial_logger.info("Norm %s: Abrogated and canceled due to unconstitutionality", norm.id)
+        return is_constitutional
+
+    def attach_event_log(self, event_log):
+        self.event_log = event_log
+        for court in (self.first_instance, self.appeal_court, self.cassation_court, self.constitutional_council):
+            court.event_log = event_log
+
+    def remove_norm(self, norm):
+        self.norms_constitutionality.forget(norm)
+        self.precedents.pop(norm.id, None)  # No new case can cite a retired norm
+        if isinstance(norm, Law):
+            self.parliament.retire_norm(norm)
+        elif isinstance(norm, Regulation):
+            self.government.retire_norm(norm)
+
+    def control_regulation_legality(self, regulation):
+        is_legal = self.rng.choice([True, False])
+        judicial_logger.info("JudicialSystem: Legality check for regulation %s: %s", regulation.id, 'legal' if is_legal else 'illegal')
+        if self.event_log is not None:
+            self.event_log.record("LEGALITY_CHECK", "JudicialSystem", regulation, value=is_legal,
+                                  detail=_CHECK_TYPE_CODES["CONTRÔLE DE LÉGALITÉ"])
+        if not is_legal:
+            law_id = int(regulation.text.split("Law ")[-1])
+            law_to_check = self.parliament.norm_pool.get(law_id)
+            if law_to_check:
+                self.control_norm_constitutionality(law_to_check)
+        return is_legal
+
+    def inspect_veto_legality(self, law):
+        is_legal = self.rng.choice([True, False])
+        judicial_logger.info("JudicialSystem: Veto legality check for law %s: %s", law.id, 'legal' if is_legal else 'illegal')
+        if self.event_log is not None:
+            self.event_log.record("LEGALITY_CHECK", "JudicialSystem", law, value=is_legal,
+                                  detail=_CHECK_TYPE_CODES["CONTRÔLE DE LÉGALITÉ DU VETO"])
+        if not is_legal:
+            self.remove_norm(law)
+            judicial_logger.info("Law %s: Veto deemed illegal and law remains invalidated", law.id)
+        else:
+            self.control_norm_constitutionality(law, "CONTRÔLE DE CONSTITUTIONNALITÉ POST-VETO")
+
+    def generate_case(self, count=1):
+        """Bring `count` new cases, each referencing a norm drawn across both pools."""
+        weighted = self.config.case_sampling == "complexity"
+        for _ in range(count):
+            # Drawn one at a time: an unconstitutional norm is abrogated before the next draw
+            if not self.norm_sampler:
+                break
+            norm = self.norm_sampler.sample(self.rng, weighted)
+            if self.case_counter not in self.case_ids:
+                new_case = Case(
+                    case_id=self.case_counter,
+                    text=f'Case {self.case_counter} referencing {norm.text}',
+                    norm_id=norm.id,
+                    constitutional=self.control_norm_constitutionality(norm),
+                    complexity=norm.complexity,
+                    norm_kind=_norm_kind_code(norm),
+                    norm_type=norm.norm_type
+                )
+                self.case_pool.append(new_case)
+                self.case_ids.add(self.case_counter)
+                self.case_counter += 1
+                judicial_logger.info("JudicialSystem: Generated new case: %s", new_case)
+
+    def control_political_actions(self, political_actions):
+        for action in political_actions:
+            new_norm = Law(
+                norm_id=self.parliament.norm_counter,
+                text=action,
+                valid=True,
+                complexity=self.rng.randint(self.config.complexity_min, self.config.complexity_max)
+            )
+            if new_norm.id not in self.parliament.norm_pool:
+                self.parliament.norm_pool.add(new_norm)
+                self.parliament.norm_counter += 1
+                self.parliament.record_norm_created(new_norm)
+                is_constitutional = self.control_norm_constitutionality(new_norm)
+                action_result = "annulled due to unconstitutionality" if not is_constitutional else "deemed constitutional"
+                judicial_logger.info("JudicialSystem: Political act '%s' %s", action, action_result)
+
+    def process_cases(self):
+        if self.scheduler is not None:
+            cases, self.case_pool = self.case_pool, []
+            self.scheduler.submit_many(cases)
+            self.scheduler.advance(1.0)  # One simulated day of hearings
+            self.metrics.record_day(self.scheduler.queue_lengths(), self.scheduler.in_service())
+            return
+        if self.batch_mode:
+            self.process_cases_batch()
+        else:
+            self.process_cases_serial()
+        self.metrics.record_day(0, 0)  # Every case is resolved the day it is filed
+
+    def process_cases_serial(self):
+        cases, self.case_pool = self.case_pool, []
+        for case in cases:
+            self.first_instance.file_case(case)
+            self.first_instance.conduct_hearing(case)
+            judgment = self.first_instance.render_judgment(case)
+            case.final_outcome = judgment
+
+            if case.final_outcome == "rejected" and not self.settle_by_precedent(case):
+                self.appeal_court.file_case(case)
+                self.appeal_court.conduct_hearing(case)
+                judgment = self.appeal_court.render_judgment(case)
+                case.final_outcome = judgment
+
+                if case.final_outcome == "rejected":
+                    while case.cassation_count < self.config.max_cassations:
+                        case.cassation_count += 1
+                        self.cassation_court.file_case(case)
+                        self.cassation_court.conduct_hearing(case)
+                        judgment = self.cassation_court.render_judgment(case)
+                        case.final_outcome = judgment
+
+                        if case.final_outcome == "rejected" and case.cassation_count < self.config.max_cassations:
+                            self.appeal_court.file_case(case)
+                            self.appeal_court.conduct_hearing(case)
+                            judgment = self.appeal_court.render_judgment(case)
+                            case.final_outcome = judgment
+
+                            if case.final_outcome == "accepted":
+                                break
+
+            self.close_case(case)
+
+    def settle_by_precedent(self, case):
+        """Settle a case rejected at first instance from similar earlier decisions, sparing it appeal and cassation.
+
+        Called for every first-instance rejection, which makes the case contested; the store is
+        only consulted when config.precedent_neighbours is set. Returns True if the case was settled.
+        """
+        case.contested = True
+        if not self.config.precedent_neighbours:
+            return False
+        outcome = self.precedent_store.verdict(case, self.config.precedent_neighbours, self.config.precedent_agreement)
+        if outcome is None:
+            return False
+        case.final_outcome = outcome
+        case.settled_by_precedent = True
+        judicial_logger.info("JudicialSystem: Case %s settled by precedent: %s", case.id, outcome)
+        return True
+
+    def close_case(self, case, time=None):
+        """Final step of every case: precedents are applied and recorded once its chain of courts ends."""
+        sojourn = time - case.filed_at if time is not None and case.filed_at is not None else 0.0
+        self.case_ids.discard(case.id)
+        self.case_archive.append(case.id, case.norm_kind, case.norm_id, case.complexity, bool(case.filed_constitutional),
+                                 case.final_outcome == "accepted", case.cassation_count, sojourn)
+        if case.cassation_count == self.config.max_cassations and case.final_outcome == "rejected":
+            judicial_logger.info("JudicialSystem: Case %s rejected after too many cassations", case.id)
+        self.apply_precedent(case)
+        self.set_precedent(case)
+        judicial_logger.info("Case %s: Processed with outcome: %s", case.id, case.final_outcome)
+
+    def process_cases_batch(self):
+        """Resolve the whole case pool with one vectorized draw per court stage.
+
+        Follows the same First Instance -> Appeal -> Cassation/Appeal chain as
+        process_cases, so final outcomes and cassation counts have the same
+        distribution, but without per-case hearings or log lines.
+        """
+        cases, self.case_pool = self.case_pool, []
+        if not cases:
+            return
+        count = len(cases)
+        accepted = np.zeros(count, dtype=np.bool_)
+        cassation_counts = np.zeros(count, dtype=np.int64)
+        if self.event_log is not None:
+            case_ids = np.fromiter((case.id for case in cases), dtype=np.int64, count=count)
+            norm_ids = np.fromiter((case.norm_id for case in cases), dtype=np.int64, count=count)
+
+        def judge(court, rows):
+            accepted[rows] = court.render_judgments(len(rows))
+            if self.event_log is not None:
+                self.event_log.record_many("JUDGMENT", court.court_name, case_ids[rows], related=norm_ids[rows],
+                                           values=accepted[rows], details=cassation_counts[rows])
+
+        judge(self.first_instance, np.arange(count))
+        pending = np.flatnonzero(~accepted)
+        if self.config.precedent_neighbours and len(pending):
+            # Precedents from earlier days only: this batch is added to the store once resolved
+            settled = []
+            for row in pending.tolist():
+                if self.settle_by_precedent(cases[row]):
+                    accepted[row] = cases[row].final_outcome == "accepted"
+                    settled.append(row)
+            pending = np.setdiff1d(pending, settled, assume_unique=True)
+        else:
+            for row in pending.tolist():
+                cases[row].contested = True
+        judge(self.appeal_court, pending)
+        pending = pending[~accepted[pending]]
+        for round_number in range(1, self.config.max_cassations + 1):
+            if not len(pending):
+                break
+            cassation_counts[pending] = round_number
+            judge(self.cassation_court, pending)
+            if round_number == self.config.max_cassations:
+                break
+            # Cases rejected in cassation are sent back to appeal; an accepted appeal closes the case
+            remanded = pending[~accepted[pending]]
+            judge(self.appeal_court, remanded)
+            pending = np.setdiff1d(pending, remanded[accepted[remanded]], assume_unique=True)
+
+        outcomes = ("rejected", "accepted")
+        batch_precedents = {}
+        for case, is_accepted, cassation_count in zip(cases, accepted.tolist(), cassation_counts.tolist()):
+            case.final_outcome = outcomes[is_accepted]
+            case.cassation_count = cassation_count
+            precedent = batch_precedents.get(case.norm_id, self.precedents.get(case.norm_id))
+            if precedent is not None:
+                case.constitutional = precedent
+                case.history.append(('constitutional', precedent, time.time()))
+            batch_precedents[case.norm_id] = case.final_outcome
+            self.precedent_store.add(case)
+        self.precedents.update(batch_precedents)
+        self.case_ids.difference_update(case.id for case in cases)
+        self.case_archive.extend(count, id=[case.id for case in cases], norm_kind=[case.norm_kind for case in cases],
+                                 norm_id=[case.norm_id for case in cases], complexity=[case.complexity for case in cases],
+                                 constitutional=[bool(case.filed_constitutional) for case in cases],
+                                 accepted=accepted, cassations=cassation_counts)
+        if self.event_log is not None:
+            self.event_log.record_many("PRECEDENT_SET", "JudicialSystem", norm_ids, related=case_ids, values=accepted)
+
+        exhausted = int(np.count_nonzero(~accepted & (cassation_counts == self.config.max_cassations)))
+        judicial_logger.info("JudicialSystem: Batch processed %s cases: %s accepted, %s rejected after too many cassations", count, int(accepted.sum()), exhausted)
+
+    def set_precedent(self, case):
+        self.precedents[case.norm_id] = case.final_outcome
+        self.precedent_store.add(case)
+        if self.event_log is not None:
+            self.event_log.record("PRECEDENT_SET", "JudicialSystem", subject=case.norm_id, related=case.id,
+                                  value=case.final_outcome == "accepted")
+        judicial_logger.info("JudicialSystem: Set precedent for norm %s: %s", case.norm_id, case.final_outcome)
+
+    def apply_precedent(self, case):
+        if case.norm_id in self.precedents:
+            case.apply_precedent(self.precedents[case.norm_id])
+            judicial_logger.info("JudicialSystem: Applied precedent to case %s: %s", case.id, case.final_outcome)
+
+    def address_expectations(self, expectations, citizen_pressure):
+        """Match expectations against the pools' text index and return the matched norms."""
+        self.caseload += citizen_pressure
+        matched = []
+        for expectation in expectations:
+            norms = self.parliament.norm_pool.with_text(expectation) + self.government.norm_pool.with_text(expectation)
+            if norms:
+                judicial_logger.info("JudicialSystem: Applying %s to relevant cases", expectation)
+                matched.extend(norms)
+        return matched
+
+    async def produce_judicial_decisions(self, iteration):
+        if self.caseload > 0 and self.valid_rules:
+            decisions_made = min(self.caseload, 5)
+            self.judicial_decisions += decisions_made
+            self.caseload -= decisions_made
+            judicial_logger.info("JudicialSystem: Produced %s judicial decisions during iteration %s. Remaining caseload: %s", decisions_made, iteration, self.caseload)
+        else:
+            judicial_logger.info("JudicialSystem: No decisions made due to lack of cases or valid rules")
+        await self.clock.sleep(0.1)
+
+    def question_prioritaire_de_constitutionnalite(self, citizen_pressure):
+        if citizen_pressure > 7:
+            judicial_logger.info("JudicialSystem: Triggered 'Question Prioritaire de Constitutionnalite' due to high citizen pressure")
+
+    def stabilize_norms(self, norms):
+        for norm in norms:
+            judicial_logger.info("Norm %s: Reinforced through consistent application", norm.id)
+
+    def apply_decisions(self, decisions):
+        for decision in decisions:
+            judicial_logger.info("JudicialSystem: Applying political decision '%s'", decision.text)
+
+    def is_legal(self):
+        return bool(self.valid_rules)
+
+    def receive_rules(self, rules):
+        self.valid_rules.extend(rules)
+        for rule in rules:
+            judicial_logger.info("Law %s est entrée en vigueur", rule)
+
+    def calculate_backlog(self):
+        backlog_length = len(self.case_pool) + (len(self.scheduler) if self.scheduler is not None else 0)
+        judicial_logger.info("JudicialSystem: Backlog length: %s", backlog_length)
+        return self.caseload
+
+    def censure_government(self):
+        """Handle the censure of the government."""
+        judicial_logger.info("JudicialSystem: The government has been censured. A new Prime Minister must be appointed.")
+        self.president.appoint_prime_minister(self.government, "New Prime Minister")
+
+class FirstInstance(Court):
+    def __init__(self, court_name, streams=None, capacity=1, mean_service_days=1.0):
+        super().__init__(court_name, streams, capacity, mean_service_days)
+        judicial_logger.info("FirstInstance Court: Initialized %s court", court_name)
+
+class Appeal(Court):
+    def __init__(self, court_name, streams=None, capacity=1, mean_service_days=1.0):
+        super().__init__(court_name, streams, capacity, mean_service_days)
+        judicial_logger.info("Appeal Court: Initialized %s court", court_name)
+
+class Cassation(Court):
+    def __init__(self, court_name, streams=None, capacity=1, mean_service_days=1.0):
+        super().__init__(court_name, streams, capacity, mean_service_days)
+        judicial_logger.info("Cassation Court: Initialized %s court", court_name)
+
+class Society:
+    def __init__(self, use_fixed_seed=True, columnar=False, batch_courts=False, clock=None, seed=None, headless=False,
+                 config=None, event_log=None, verdict_cache_size=None, scenario=None, results_dir=None, scheduled_courts=False,
+                 archive_dir=None):
+        if seed is None and use_fixed_seed:
+            seed = 1
+        self.config = config if config is not None else SimulationConfig()
+        # Per-instance random streams, so several societies can run side by side
+        self.streams = RandomStreams(seed)
+        self.rng = self.streams.random
+        president_streams, prime_minister_streams, government_streams, parliament_streams, judicial_streams = self.streams.spawn(5)
+        # Columnar mode keeps the norm pools in NumPy arrays (NormStore) instead of Norm objects
+        pool_class = NormStore if columnar else NormRegistry
+        self.president = President("Jean Dupont", pool_class=pool_class, streams=president_streams, config=self.config)
+        self.prime_minister = PrimeMinister("Alice Martin", pool_class=pool_class, streams=prime_minister_streams, config=self.config)
+        self.government = Government(prime_minister=self.prime_minister.name, pool_class=pool_class, streams=government_streams,
+                                     config=self.config)
+        self.parliament = Parliament(pool_class=pool_class, streams=parliament_streams, config=self.config)
+        self.clock = clock if clock is not None else RealTimeClock()
+        self.judicial_system = JudicialSystem(self.parliament, self.government, self.president, batch_mode=batch_courts,
+                                              clock=self.clock, streams=judicial_streams, config=self.config,
+                                              verdict_cache_size=verdict_cache_size, scheduled=scheduled_courts)
+        self.parliament.judicial_system = self.judicial_system
+        self.government.judicial_system = self.judicial_system
+        self.court_metrics = self.judicial_system.metrics  # Per-stage backlog and latency KPIs
+        self.precedent_store = self.judicial_system.precedent_store  # Recent court decisions, indexed by similarity
+        # Closed cases, court visits and retired norms go to compact archives, spilled to disk with archive_dir
+        self.archives = {
+            "cases": self.judicial_system.case_archive,
+            "court_visits": self.court_metrics.visits,
+            "parliament": self.parliament.archive,
+            "government": self.government.archive,
+            "prime_minister": self.prime_minister.archive,
+            "president": self.president.archive,
+        }
+        if archive_dir is not None:
+            os.makedirs(archive_dir, exist_ok=True)
+            for name, archive in self.archives.items():
+                archive.spill_to(os.path.join(archive_dir, f"{name}.arc"))
+        # Structured event stream (EventLog), written alongside the Journal Officiel
+        self.event_log = event_log
+        if event_log is not None:
+            for body in (self.president, self.prime_minister, self.government, self.parliament):
+                body.event_log = event_log
+            self.judicial_system.attach_event_log(event_log)
+        self.headless = headless  # Skip the end-of-run analysis and plots, e.g. in ensemble workers
+        self.results_dir = results_dir  # Write the figure there instead of showing it
+        # Exogenous events and citizen pressure for the whole run: a Scenario, a scenario file, or drawn here
+        scenario_generator = self.streams.spawn(1)[0].generator
+        if scenario is None:
+            scenario = Scenario.generate(self.config.simulation_days, scenario_generator, self.config)
+        elif not isinstance(scenario, Scenario):
+            scenario = Scenario.load(scenario, self.config.simulation_days, scenario_generator, self.config)
+        if len(scenario) < self.config.simulation_days:
+            raise ValueError(f"Scenario covers {len(scenario)} days, the run needs {self.config.simulation_days}")
+        self.scenario = scenario
+        self.drift_rng = self.streams.spawn(1)[0].generator  # Complexity drift, drawn after the other streams
+        self.iteration = 0
+        # Checks already run today (generation = day), so repeated checks within a day are free
+        self.constitutionality_checks = CheckMemo()
+        self.legality_checks = CheckMemo()
+        # Per-day series plus norm-state deltas pushed by the pools, instead of daily snapshots
+        self.history = HistoryRecorder(self.config.simulation_days)
+        self.parliament.norm_pool.listener = self.history
+        self.government.norm_pool.listener = self.history
+        # Live statistics, readable at any point of the run
+        self.correlations = RunningCorrelation(("caseload", "normative_inflation", "temporal_gap"))
+        self.granger = RunningGranger(max_lag=10)  # Caseload -> normative inflation, as in perform_granger_test
+
+    @property
+    def caseload_history(self):
+        return self.history["caseload"]
+
+    @property
+    def normative_inflation_history(self):
+        return self.history["normative_inflation"]
+
+    @property
+    def temporal_gap_history(self):
+        return self.history["temporal_gap"]
+
+    def check_constitutionality(self, norm, current_iteration):
+        try:
+            self.constitutionality_checks.advance(current_iteration)
+            if norm not in self.constitutionality_checks:
+                is_constitutional = self.judicial_system.control_norm_constitutionality(norm)
+                self.constitutionality_checks.put(norm, is_constitutional)
+            else:
+                society_logger.info("Norm %s: Already checked in this iteration", norm.id)
+        except Exception as e:
+            society_logger.info("Norm %s: Error checking constitutionality: %s", norm.id, str(e))
+
+    def check_legality(self, regulation, current_iteration):
+        try:
+            self.legality_checks.advance(current_iteration)
+            if regulation not in self.legality_checks:
+                is_legal = self.judicial_system.control_regulation_legality(regulation)
+                self.legality_checks.put(regulation, is_legal)
+            else:
+                society_logger.info("Regulation %s: Already checked in this iteration", regulation.id)
+        except Exception as e:
+            society_logger.info("Regulation %s: Error checking legality: %s", regulation.id, str(e))
+
+    async def simulate(self):
+        while self.iteration < self.config.simulation_days:
+            self.iteration += 1
+            self.history.day = self.iteration
+            for archive in self.archives.values():
+                archive.day = self.iteration
+            society_logger.info("\n\n--- DAY %s ---\n", self.iteration)
+            if self.event_log is not None:
+                self.event_log.day = self.iteration
+
+            event = self.scenario.event(self.iteration)
+            citizen_pressure = self.scenario.pressure(self.iteration)
+            political_logger.info("%s: Random event occurred: %s", self.parliament.get_body_name(), event)
+
+            self.parliament.generate_norms()
+            self.government.generate_norms()
+
+            vetoed_regulation, vetoed_law = self.president.attempt_veto(self.parliament.norm_pool)
+            if vetoed_regulation and vetoed_law:  # Check if both regulation and law exist
+                self.judicial_system.inspect_veto_legality(vetoed_law)
+
+            self.judicial_system.generate_case(self.config.cases_per_day)
+            self.judicial_system.process_cases()
+
+            expectations = self.parliament.send_expectations(citizen_pressure)
+            self.judicial_system.address_expectations(expectations, citizen_pressure)
+            
+            regulations = self.government.make_regulations(citizen_pressure)
+            for regulation in regulations:
+                self.check_legality(regulation, self.iteration)
+                
+            self.judicial_system.apply_decisions(regulations)
+
+            new_rules = self.parliament.perform_actions()
+            self.judicial_system.receive_rules(new_rules)
+            await self.judicial_system.produce_judicial_decisions(self.iteration)
+
+            political_actions = self.parliament.perform_actions()
+            self.judicial_system.control_political_actions(political_actions)
+
+            if self.rng.random() < self.config.reform_probability and self.parliament.norm_pool:  # Chance to reform a norm each day (10% by default)
+                norm_to_reform = self.parliament.norm_pool.sample(self.rng)
+                self.parliament.reform_norm(norm_to_reform.id)
+
+            if self.config.complexity_drift:
+                self.drift_complexity()
+
+            self.track_histories()
+            self.print_status()
+            self.parliament.norm_pool.compact()
+            self.government.norm_pool.compact()
+
+        await self.finalize_simulation()
+
+
+    def adjust_citizen_pressure(self, event, citizen_pressure):
+        if event not in PRESSURE_ADJUSTMENTS:
+            return citizen_pressure
+        low, high, sign = PRESSURE_ADJUSTMENTS[event]
+        return citizen_pressure + sign * self.rng.randint(low, high)
+
+    def drift_complexity(self):
+        """Move every norm's complexity by a random step of at most config.complexity_drift, within the config bounds."""
+        drift = self.config.complexity_drift
+        for pool in (self.parliament.norm_pool, self.government.norm_pool):
+            steps = self.drift_rng.integers(-drift, drift, size=len(pool), endpoint=True)
+            pool.adjust_complexity(steps, low=self.config.complexity_min, high=self.config.complexity_max)
+
+    def track_histories(self):
+        caseload = self.judicial_system.caseload
+        normative_inflation = len(self.parliament.norm_pool) + len(self.government.norm_pool)
+        temporal_gap = self.parliament.norm_counter + self.government.norm_counter - caseload
+        self.history.record_day(
+            caseload=caseload,
+            normative_inflation=normative_inflation,
+            temporal_gap=temporal_gap,
+            judicial_decisions=self.judicial_system.judicial_decisions,
+            valid_rules=self.judicial_system.valid_rules,
+        )
+        self.correlations.update((caseload, normative_inflation, temporal_gap))
+        self.granger.update(normative_inflation, caseload)
+
+    def print_status(self):
+        normative_inflation = self.parliament.norm_counter + self.government.norm_counter
+        caseload = self.judicial_system.caseload
+        temporal_gap = normative_inflation - caseload
+        society_logger.info("Society: Normative Inflation: %s, Caseload: %s, Temporal Gap: %s", normative_inflation, caseload, temporal_gap)
+        society_logger.info("Society: Processing up to 5 cases per day, total processed: %s", self.judicial_system.judicial_decisions)
+
+    async def finalize_simulation(self):
+        self.history.day = self.iteration + 1  # End-of-run norms land after the last recorded day
+        self.parliament.generate_norms()
+        self.government.generate_norms()
+        for norm in list(self.parliament.norm_pool) + list(self.government.norm_pool):
+            self.judicial_system.control_norm_constitutionality(norm, "CONTRÔLE DE CONSTITUTIONNALITÉ")
+
+        await self.clock.sleep(0.1)
+        if not self.headless:
+            self.analyze()
+        if self.event_log is not None:
+            self.event_log.flush()
+        for archive in self.archives.values():
+            archive.flush()
+        flush_journal()
+
+    def analyze(self):
+        """End-of-run analysis: correlations, results figure and Granger tests."""
+        self.calculate_correlations()
+        self.plot_results()
+        self.perform_granger_test()
+
+    def calculate_correlations(self):
+        pearson_caseload_normative_inflation = self.correlations.pearson("caseload", "normative_inflation")
+        pearson_caseload_temporal_gap = self.correlations.pearson("caseload", "temporal_gap")
+        pearson_normative_inflation_temporal_gap = self.correlations.pearson("normative_inflation", "temporal_gap")
+
+        society_logger.info('Society: Pearson correlation between Caseload and Normative Inflation: %s', pearson_caseload_normative_inflation)
+        society_logger.info('Society: Pearson correlation between Caseload and Temporal Gap: %s', pearson_caseload_temporal_gap)
+        society_logger.info('Society: Pearson correlation between Normative Inflation and Temporal Gap: %s', pearson_normative_inflation_temporal_gap)
+
+    def plot_results(self):
+        """Show the figure, or write it to results_dir/results.png when the Society has a results directory."""
+        if self.results_dir is not None:
+            return render_results(self.result_series(), os.path.join(self.results_dir, "results.png"))
+        import matplotlib.pyplot as plt  # Plotting is only loaded by runs that draw
+
+        figure = plt.figure(figsize=(9, 6))
+        _draw_results(figure, self.result_series())
+        plt.show()
+
+    def result_series(self):
+        return {
+            'caseload': self.caseload_history,
+            'normative_inflation': self.normative_inflation_history,
+            'temporal_gap': self.temporal_gap_history,
+        }
+
+    def perform_granger_test(self):
+        max_lag = 10
+        if self.history.days <= 3 * max_lag + 1:
+            society_logger.warning("Society: Granger test skipped, %s days are too few for %s lags", self.history.days, max_lag)
+            return
+        f_statistics, p_values, df_denom = granger_tests(self.normative_inflation_history, self.caseload_history, max_lag)
+        for lag in range(1, max_lag + 1):
+            society_logger.info("Society: Lag %s - F-test: %s, P-value: %s", lag,
+                                (float(f_statistics[lag - 1]), float(p_values[lag - 1]), int(df_denom[lag - 1]), lag),
+                                float(p_values[lag - 1]))
+
+# Key, label, y axis, title and colour of each panel of the results figure
+RESULT_PANELS = [
+    ('caseload', 'Caseload', 'Caseload', 'Caseload over Time', None),
+    ('normative_inflation', 'Normative Inflation', 'Number of Norms', 'Normative Inflation over Time', 'red'),
+    ('temporal_gap', 'Temporal Gap', 'Temporal Gap (Norms - Caseload)', 'Temporal Gap over Time', None),
+]
+PLOT_BUCKETS = 1000  # About one bucket per horizontal pixel of a panel
+
+def downsample_minmax(values, buckets=PLOT_BUCKETS):
+    """Reduce a daily series to the min and max of each of `buckets` equal slices of days.
+
+    Returns (days, values) with days 1-based and in order, so a line plot keeps every
+    peak and trough while drawing at most 2 * buckets points.
+    """
+    values = np.asarray(values)
+    days = np.arange(1, len(values) + 1)
+    if len(values) <= 2 * buckets:
+        return days, values
+    edges = np.linspace(0, len(values), buckets + 1).astype(np.int64)
+    lows = np.minimum.reduceat(values, edges[:-1])
+    highs = np.maximum.reduceat(values, edges[:-1])
+    picked = []
+    for start, stop, low, high in zip(edges[:-1], edges[1:], lows, highs):
+        chunk = values[start:stop]
+        first, second = sorted((start + int(np.argmax(chunk == low)), start + int(np.argmax(chunk == high))))
+        picked.extend((first, second) if first != second else (first,))
+    picked = np.array(picked)
+    return days[picked], values[picked]
+
+def _draw_results(figure, series, buckets=PLOT_BUCKETS):
+    for position, (key, label, ylabel, title, color) in enumerate(RESULT_PANELS, 1):
+        axes = figure.add_subplot(2, 2, position)
+        axes.plot(*downsample_minmax(series[key], buckets), label=label, color=color)
+        axes.set_xlabel('Iteration')
+        axes.set_ylabel(ylabel)
+        axes.set_title(title)
+        axes.legend()
+    figure.suptitle('Caseload, Normative Inflation, and Temporal Gap Analysis')
+    figure.tight_layout()
+
+def render_results(series, path, buckets=PLOT_BUCKETS):
+    """Write the results figure to `path` with the Agg canvas; never touches pyplot's global state."""
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    figure = Figure(figsize=(9, 6))
+    FigureCanvasAgg(figure)
+    _draw_results(figure, series, buckets)
+    figure.savefig(path)
+    return path
+
+def _render_run(name, series, results_dir, buckets):
+    return render_results(series, os.path.join(results_dir, name, "results.png"), buckets)
+
+def render_runs(runs, results_dir="results", max_workers=None, buckets=PLOT_BUCKETS):
+    """Render {run name: series} to results_dir/<run name>/results.png across a process pool."""
+    names = list(runs)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        paths = list(executor.map(_render_run, names, (runs[name] for name in names), itertools.repeat(results_dir),
+                                  itertools.repeat(buckets)))
+    society_logger.info("Rendering: %s figures written to %s", len(paths), results_dir)
+    return paths
+
+class EnsembleResult:
+    """Histories of an ensemble run, stacked as (seed x day) arrays."""
+
+    def __init__(self, seeds, caseload, normative_inflation, temporal_gap, seed_wall_times, wall_time):
+        self.seeds = seeds
+        self.caseload = caseload
+        self.normative_inflation = normative_inflation
+        self.temporal_gap = temporal_gap
+        self.seed_wall_times = seed_wall_times
+        self.wall_time = wall_time
+
+    def granger(self, max_lag=10):
+        """Caseload -> normative inflation Granger tests for every seed, as (seed x lag) arrays."""
+        return granger_tests(self.normative_inflation, self.caseload, max_lag)
+
+    def render(self, results_dir="results", max_workers=None):
+        """Write one results figure per seed, to results_dir/seed-<seed>/results.png."""
+        runs = {
+            f"seed-{seed}": {'caseload': caseload, 'normative_inflation': normative_inflation, 'temporal_gap': temporal_gap}
+            for seed, caseload, normative_inflation, temporal_gap
+            in zip(self.seeds, self.caseload, self.normative_inflation, self.temporal_gap)
+        }
+        return render_runs(runs, results_dir, max_workers)
+
+def _init_ensemble_worker():
+    quiet_mode()
+
+def _simulate_seed(seed, society_options):
+    start = time.perf_counter()
+    society = Society(seed=seed, clock=VirtualClock(), headless=True, **society_options)
+    asyncio.run(society.simulate())
+    return (society.caseload_history, society.normative_inflation_history, society.temporal_gap_history,
+            time.perf_counter() - start)
+
+def run_ensemble(seeds, max_workers=None, **society_options):
+    """Simulate one headless Society per seed across a process pool.
+
+    Extra keyword arguments are passed to every Society (e.g. columnar=True).
+    """
+    seeds = list(seeds)
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_ensemble_worker) as executor:
+        runs = list(executor.map(_simulate_seed, seeds, itertools.repeat(society_options)))
+    result = EnsembleResult(
+        seeds=np.array(seeds),
+        caseload=np.array([run[0] for run in runs]),
+        normative_inflation=np.array([run[1] for run in runs]),
+        temporal_gap=np.array([run[2] for run in runs]),
+        seed_wall_times=np.array([run[3] for run in runs]),
+        wall_time=time.perf_counter() - start,
+    )
+    for seed, seconds in zip(seeds, result.seed_wall_times):
+        society_logger.info("Ensemble: Seed %s simulated in %.3fs", seed, seconds)
+    society_logger.info("Ensemble: %s seeds simulated in %.3fs (%.3fs of worker time)",
+                        len(seeds), result.wall_time, result.seed_wall_times.sum())
+    return result
+
+def grid_design(**axes):
+    """Full factorial design: one point per combination of the given axis values."""
+    names = list(axes)
+    return [dict(zip(names, values)) for values in itertools.product(*(axes[name] for name in names))]
+
+def latin_hypercube_design(bounds, samples, seed=None):
+    """Latin-hypercube design over `bounds` ({name: (low, high)}); integer fields are rounded."""
+    rng = np.random.default_rng(seed)
+    defaults = SimulationConfig()
+    design = [{} for _ in range(samples)]
+    for name, (low, high) in bounds.items():
+        strata = (rng.permutation(samples) + rng.random(samples)) / samples
+        values = low + strata * (high - low)
+        is_integer = isinstance(getattr(defaults, name), int)
+        for point, value in zip(design, values):
+            point[name] = int(round(value)) if is_integer else float(value)
+    return design
+
+def _run_key_value(value):
+    if isinstance(value, Scenario):
+        return {'scenario': value.digest()}
+    raise TypeError(f"Cannot build a stable run key from {type(value).__name__} option values")
+
+def run_key(config, seed, society_options):
+    """Stable hash of everything that determines a run's histories.
+
+    Options must be JSON values or Scenarios (hashed by content); anything else raises
+    TypeError rather than risk a key that depends on the process.
+    """
+    payload = json.dumps({'config': asdict(config), 'seed': seed, 'options': society_options}, sort_keys=True,
+                         default=_run_key_value)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+def _load_cached_run(path):
+    with np.load(path) as cached:
+        return (cached['caseload'].tolist(), cached['normative_inflation'].tolist(), cached['temporal_gap'].tolist(),
+                float(cached['wall_time']))
+
+def _store_cached_run(path, run):
+    temporary_path = f"{path}.tmp"
+    with open(temporary_path, 'wb') as cache_file:
+        np.savez(cache_file, caseload=run[0], normative_inflation=run[1], temporal_gap=run[2], wall_time=run[3])
+    os.replace(temporary_path, path)  # Never leave a half-written entry behind
+
+def run_sweep(design, seeds, cache_dir="sweep_cache", base_config=None, max_workers=None, **society_options):
+    """Run every design point for every seed across a process pool, caching each run on disk.
+
+    `design` is a list of {field: value} overrides of `base_config` (see grid_design and
+    latin_hypercube_design). Runs already in `cache_dir` are loaded instead of recomputed,
+    so re-running a sweep only simulates the missing points. Returns a list of
+    (config, EnsembleResult) pairs in design order; an EnsembleResult's wall_time is the
+    summed simulation time of its seeds.
+    """
+    base_config = base_config if base_config is not None else SimulationConfig()
+    valid_fields = {field.name for field in fields(SimulationConfig)}
+    configs = []
+    for point in design:
+        unknown = set(point) - valid_fields
+        if unknown:
+            raise ValueError(f"Unknown simulation parameters: {sorted(unknown)}")
+        configs.append(replace(base_config, **point))
+    seeds = list(seeds)
+    os.makedirs(cache_dir, exist_ok=True)
+
+    runs = {}
+    missing = {}
+    for config in configs:
+        for seed in seeds:
+            path = os.path.join(cache_dir, f"{run_key(config, seed, society_options)}.npz")
+            if path in runs or path in missing:
+                continue
+            if os.path.exists(path):
+                runs[path] = _load_cached_run(path)
+            else:
+                missing[path] = (config, seed)
+    society_logger.info("Sweep: %s points x %s seeds, %s cached, %s to simulate", len(configs), len(seeds), len(runs), len(missing))
+
+    if missing:
+        start = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_ensemble_worker) as executor:
+            futures = {executor.submit(_simulate_seed, seed, dict(society_options, config=config)): path
+                       for path, (config, seed) in missing.items()}
+            for future in as_completed(futures):
+                path = futures[future]
+                runs[path] = future.result()
+                _store_cached_run(path, runs[path])
+        society_logger.info("Sweep: Simulated %s runs in %.3fs", len(missing), time.perf_counter() - start)
+
+    results = []
+    for config in configs:
+        point_runs = [runs[os.path.join(cache_dir, f"{run_key(config, seed, society_options)}.npz")] for seed in seeds]
+        results.append((config, EnsembleResult(
+            seeds=np.array(seeds),
+            caseload=np.array([run[0] for run in point_runs]),
+            normative_inflation=np.array([run[1] for run in point_runs]),
+            temporal_gap=np.array([run[2] for run in point_runs]),
+            seed_wall_times=np.array([run[3] for run in point_runs]),
+            wall_time=sum(run[3] for run in point_runs),
+        )))
+    return results
+
+async def main():
+    configure_logger()
+    society = Society()
+    await society.simulate()
+
+@contextmanager
+def _journal_scope(directory, quiet):
+    """Journals in `directory` (and quiet mode) for the duration of a run; the host's logging is restored after."""
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    saved_levels = {name: logger.level for name, logger in
+                    [('matplotlib', logging.getLogger('matplotlib'))] + list(SUBSYSTEM_LOGGERS.items())}
+    root.handlers = []  # Detached, not closed: they belong to the host
+    try:
+        configure_logger(directory=directory)
+        if quiet:
+            quiet_mode()
+        yield
+    finally:
+        for handler in root.handlers[:]:
+            handler.flush()
+            handler.close()
+        root.handlers = saved_handlers
+        root.setLevel(saved_level)
+        logging.getLogger('matplotlib').setLevel(saved_levels.pop('matplotlib'))
+        for name, level in saved_levels.items():
+            SUBSYSTEM_LOGGERS[name].setLevel(level)
+
+async def run(days=SIMULATION_DAYS, seed=None, out=None, quiet=False):
+    """One fast-forwarded run, as driven by `python -m optimus run`.
+
+    With `out`, the journals, the event log, the per-day history (history.npz), the
+    archives of closed cases and retired norms (archive/) and the results figure are
+    written there, the history before the end-of-run analysis; without it the run is
+    headless. Logging is set up for the run only and the caller's handlers and levels
+    are put back afterwards.
+    """
+    if out is not None:
+        os.makedirs(out, exist_ok=True)
+    with _journal_scope(out or ".", quiet):
+        event_log = EventLog(os.path.join(out, "events.evt")) if out is not None else None
+        society = None
+        try:
+            society = Society(seed=seed, config=SimulationConfig(simulation_days=days), clock=VirtualClock(),
+                              headless=True, results_dir=out, event_log=event_log,
+                              archive_dir=os.path.join(out, "archive") if out is not None else None)
+            await society.simulate()
+        finally:
+            if event_log is not None:
+                event_log.close()
+            if out is not None and society is not None:
+                for archive in society.archives.values():
+                    archive.close()
+        if out is not None:
+            np.savez(os.path.join(out, "history.npz"), days=np.arange(1, society.history.days + 1),
+                     **{name: society.history[name] for name in HISTORY_SERIES})
+            society.analyze()
+    return society
+
+def cli(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="optimus", description="Simulate the Rule of Law: political and judicial systems over time.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser("run", help="Simulate one society")
+    run_parser.add_argument("--days", type=int, default=SIMULATION_DAYS, help="Number of simulated days (default: %(default)s)")
+    run_parser.add_argument("--seed", type=int, default=1, help="Seed of the run's random streams (default: %(default)s)")
+    run_parser.add_argument("--quiet", action="store_true", help="Only log warnings and errors")
+    run_parser.add_argument("--out", metavar="DIR", help="Write journals, event log, history, archives and figure to DIR")
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        society = asyncio.run(run(days=args.days, seed=args.seed, out=args.out, quiet=args.quiet))
+        print(f"{society.iteration} days simulated: caseload {society.judicial_system.caseload}, "
+              f"{society.judicial_system.judicial_decisions} judicial decisions")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(cli())
+
+
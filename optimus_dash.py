@@ -1,17 +1,9 @@
 import asyncio
 import numpy as np
-import statsmodels.api as sm
-from statsmodels.tsa.stattools import grangercausalitytests
-import matplotlib
-matplotlib.use('Agg')  # Set the backend to 'Agg'
-import matplotlib.pyplot as plt
 import random
 import time
 import logging
-import networkx as nx
-import plotly.graph_objects as go
-from dash import Dash, dcc, html
-from dash.dependencies import Input, Output
+import os
 import threading
 
 # Configure global logger
@@ -38,21 +30,15 @@ def configure_logger():
 
 configure_logger()
 
-# Set up Dash app for interactive graph
-app = Dash(__name__)
-G = nx.DiGraph()
-nodes = ["Judiciary", "Legislature", "Executive", "Political System", "Society", "Norms"]
-G.add_nodes_from(nodes)
-edges = [("Judiciary", "Legislature"), ("Legislature", "Executive"),
+# Dash, Plotly and NetworkX are only imported when the dashboard is built
+NODES = ["Judiciary", "Legislature", "Executive", "Political System", "Society", "Norms"]
+EDGES = [("Judiciary", "Legislature"), ("Legislature", "Executive"),
          ("Executive", "Political System"), ("Political System", "Society"),
          ("Society", "Norms"), ("Norms", "Judiciary")]
-G.add_edges_from(edges)
 
-# Layout for the graph
-pos = nx.spring_layout(G, seed=42)
+def create_figure(G, pos):
+    import plotly.graph_objects as go
 
-# Initial Dash graph figure
-def create_figure():
     fig = go.Figure()
     for node in G.nodes:
         x, y = pos[node]
@@ -79,28 +65,44 @@ def create_figure():
     )
     return fig
 
-# Dash app layout
-app.layout = html.Div([
-    html.H1("Optimus System - Real-Time Graph"),
-    dcc.Graph(id="live-graph", figure=create_figure()),
-    dcc.Interval(id="interval-component", interval=1000, n_intervals=0)  # Updates every second
-])
-
-# Update graph callback based on simulation state
-@app.callback(
-    Output("live-graph", "figure"),
-    [Input("interval-component", "n_intervals")]
-)
-def update_graph(n):
-    # Example: Update node colors based on random simulation data
-    for node in G.nodes:
-        G.nodes[node]["color"] = "lightgreen" if random.random() > 0.5 else "lightcoral"
-    fig = create_figure()
-    return fig
+def create_app():
+    import networkx as nx
+    from dash import Dash, dcc, html
+    from dash.dependencies import Input, Output
+
+    # Set up Dash app for interactive graph
+    app = Dash(__name__)
+    G = nx.DiGraph()
+    G.add_nodes_from(NODES)
+    G.add_edges_from(EDGES)
+
+    # Layout for the graph
+    pos = nx.spring_layout(G, seed=42)
+
+    # Dash app layout
+    app.layout = html.Div([
+        html.H1("Optimus System - Real-Time Graph"),
+        dcc.Graph(id="live-graph", figure=create_figure(G, pos)),
+        dcc.Interval(id="interval-component", interval=1000, n_intervals=0)  # Updates every second
+    ])
+
+    # Update graph callback based on simulation state
+    @app.callback(
+        Output("live-graph", "figure"),
+        [Input("interval-component", "n_intervals")]
+    )
+    def update_graph(n):
+        # Example: Update node colors based on random simulation data
+        for node in G.nodes:
+            G.nodes[node]["color"] = "lightgreen" if random.random() > 0.5 else "lightcoral"
+        fig = create_figure(G, pos)
+        return fig
+
+    return app
 
 # Start Dash server in a separate thread
 def run_dash():
-    app.run_server(debug=False, use_reloader=False)
+    create_app().run_server(debug=False, use_reloader=False)
 
 # Constants
 COMPLEXITY_MIN = 1
@@ -746,7 +748,7 @@ class Society:
     norms = {}
     regulations = {}
 
-    def __init__(self, use_fixed_seed=True):
+    def __init__(self, use_fixed_seed=True, results_dir="results"):
         if use_fixed_seed:
             random.seed(1)
         self.president = President("Jean Dupont")
@@ -757,11 +759,27 @@ class Society:
         self.parliament.judicial_system = self.judicial_system
         self.government.judicial_system = self.judicial_system
         self.iteration = 0
+        # Each run writes its figures to its own directory instead of overwriting results.png
+        self.run_dir = self.claim_run_dir(results_dir)
         self.caseload_history = []
         self.normative_inflation_history = []
         self.temporal_gap_history = []
         self.history = []
 
+    @staticmethod
+    def claim_run_dir(results_dir):
+        """Create and return a fresh run directory; runs started in the same second get -2, -3, ... suffixes."""
+        os.makedirs(results_dir, exist_ok=True)
+        base = os.path.join(results_dir, time.strftime("run-%Y%m%d-%H%M%S"))
+        run_dir, suffix = base, 1
+        while True:
+            try:
+                os.makedirs(run_dir)
+                return run_dir
+            except FileExistsError:
+                suffix += 1
+                run_dir = f"{base}-{suffix}"
+
     def check_constitutionality(self, norm, current_iteration):
         try:
             if norm.id not in Society.norms or Society.norms[norm.id]['last_checked_iteration'] != current_iteration:
@@ -879,6 +897,10 @@ class Society:
         logging.info(f'Society: Pearson correlation between Normative Inflation and Temporal Gap: {pearson_normative_inflation_temporal_gap}')
 
     def plot_results(self):
+        import matplotlib
+        matplotlib.use('Agg')  # Set the backend to 'Agg'
+        import matplotlib.pyplot as plt
+
         plt.figure(figsize=(9, 6))
 
         plt.subplot(2, 2, 1)
@@ -904,10 +926,13 @@ class Society:
 
         plt.suptitle('Caseload, Normative Inflation, and Temporal Gap Analysis')
         plt.tight_layout()
-        plt.savefig('results.png')  # Save the plot to a file
+        os.makedirs(self.run_dir, exist_ok=True)
+        plt.savefig(os.path.join(self.run_dir, 'results.png'))  # Save the plot to this run's directory
         plt.close()  # Close the plot to free up memory
 
     def perform_granger_test(self):
+        from statsmodels.tsa.stattools import grangercausalitytests
+
         data = np.column_stack((self.normative_inflation_history, self.caseload_history))
         max_lag = 10
         test_result = grangercausalitytests(data, max_lag, verbose=True)